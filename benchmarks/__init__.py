@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+""" Benchmarks of the EU tender code paths
+
+Every module builds a synthetic tender in memory and times the previous
+implementation against the current one, e.g.::
+
+    bin/python -m benchmarks.lots
+
+No running application is needed, modules that need a database say so.
+"""
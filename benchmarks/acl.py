@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+""" Tender ACL: building the list on every call against the cached one """
+from pyramid.security import Allow
+from benchmarks.base import get_tender, fresh, compare
+
+
+def old_acl(tender):
+    acl = [
+        (Allow, '{}_{}'.format(i.owner, i.owner_token), 'create_qualification_complaint')
+        for i in tender.bids
+        if i.status in ['active', 'unsuccessful']
+    ]
+    acl.extend([
+        (Allow, '{}_{}'.format(i.owner, i.owner_token), 'create_award_complaint')
+        for i in tender.bids
+        if i.status == 'active'
+    ])
+    acl.extend([
+        (Allow, '{}_{}'.format(tender.owner, tender.owner_token), 'edit_tender'),
+        (Allow, '{}_{}'.format(tender.owner, tender.owner_token), 'upload_tender_documents'),
+        (Allow, '{}_{}'.format(tender.owner, tender.owner_token), 'edit_complaint'),
+    ])
+    return acl
+
+
+def main():
+    for bids in [100, 500, 1000]:
+        tender = get_tender(bids=bids)
+        assert sorted(old_acl(tender)) == sorted(tender.__acl__())
+        # pyramid reads ACL of the context for every permission check
+        for calls in [1, 3]:
+            def old():
+                for i in range(calls):
+                    old_acl(tender)
+
+            def new():
+                fresh(tender)
+                for i in range(calls):
+                    tender.__acl__()
+
+            compare('ACL of {} bids, {} calls per request'.format(bids, calls), old, new)
+
+
+if __name__ == '__main__':
+    main()
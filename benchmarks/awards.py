@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+""" Awards of every lot: filtering of all awards per lot against grouping
+    awards by lot once
+"""
+from benchmarks.base import get_tender, fresh, compare
+
+
+def main():
+    for bids, lots, awards in [(100, 3, 10), (500, 10, 50), (1000, 20, 100)]:
+        tender = get_tender(bids=bids, lots=lots, awards=awards)
+
+        def old():
+            return [[i for i in tender.awards if i.lotID == lot.id] for lot in tender.lots]
+
+        def new():
+            fresh(tender)
+            awards_by_lot = tender.awards_by_lot()
+            return [awards_by_lot.get(lot.id, []) for lot in tender.lots]
+
+        assert old() == new()
+        compare('awards of {} lots, {} awards per lot'.format(lots, awards), old, new)
+
+
+if __name__ == '__main__':
+    main()
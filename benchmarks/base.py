@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import timeit
+from copy import deepcopy
+from uuid import uuid4
+from openprocurement.tender.openeu.models import Tender, invalidate_tender_cache
+from openprocurement.tender.openeu.tests.base import test_tender_data, test_bids, test_lots
+
+
+def get_tender_data(bids=100, lots=0, awards=0, status='active.qualification'):
+    """ returns data of a tender with the given number of bids and lots
+
+        Each bid is for all lots, bids go through all statuses. Given number
+        of unsuccessful awards is added for the tender or for each lot.
+    """
+    data = deepcopy(test_tender_data)
+    data['id'] = uuid4().hex
+    data['owner'] = 'broker'
+    data['owner_token'] = uuid4().hex
+    data['status'] = status
+    data['lots'] = []
+    for index in range(lots):
+        lot = deepcopy(test_lots[0])
+        lot['id'] = uuid4().hex
+        lot['status'] = 'active'
+        data['lots'].append(lot)
+    statuses = ['active', 'pending', 'unsuccessful', 'invalid', 'deleted']
+    data['bids'] = []
+    for index in range(bids):
+        bid = deepcopy(test_bids[index % len(test_bids)])
+        bid['id'] = uuid4().hex
+        bid['owner'] = 'broker'
+        bid['owner_token'] = uuid4().hex
+        bid['status'] = statuses[index % len(statuses)]
+        if data['lots']:
+            value = bid.pop('value')
+            bid['lotValues'] = [
+                {'value': dict(value, amount=value['amount'] - index % 100), 'relatedLot': lot['id']}
+                for lot in data['lots']
+            ]
+        data['bids'].append(bid)
+    data['awards'] = []
+    for lot in data['lots'] or [None]:
+        for bid in data['bids'][:awards]:
+            data['awards'].append({
+                'id': uuid4().hex,
+                'bid_id': bid['id'],
+                'lotID': lot and lot['id'],
+                'status': 'unsuccessful',
+                'suppliers': bid['tenderers'],
+                'date': test_tender_data['tenderPeriod']['endDate'],
+                'complaintPeriod': {
+                    'startDate': test_tender_data['tenderPeriod']['endDate'],
+                    'endDate': test_tender_data['tenderPeriod']['endDate'],
+                },
+            })
+    return data
+
+
+def get_tender(**kwargs):
+    return Tender(get_tender_data(**kwargs))
+
+
+class Request(object):
+    """ request with the validated tender as views pass it to utils """
+
+    def __init__(self, tender):
+        self.validated = {'tender': tender}
+
+
+def fresh(tender):
+    """ drops data cached on the tender as if it was loaded by a new request """
+    invalidate_tender_cache(tender)
+
+
+def compare(title, old, new, number=10, repeat=3):
+    """ prints time of a single run of the old and the new implementations """
+    old_time = min(timeit.repeat(old, number=number, repeat=repeat)) / number
+    new_time = min(timeit.repeat(new, number=number, repeat=repeat)) / number
+    print('{}: old {:.6f}s, new {:.6f}s, {:.1f}x'.format(title, old_time, new_time, old_time / new_time))
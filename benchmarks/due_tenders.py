@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+""" Scaling of get_due_tenders with the number of stored tenders
+
+Needs a CouchDB server, its url is taken from COUCHDB_URL environment
+variable (http://localhost:5984 by default). A temporary database is
+created for every size and deleted afterwards.
+"""
+import os
+import timeit
+from datetime import timedelta
+from random import randint
+from uuid import uuid4
+from couchdb import Server
+from openprocurement.api.models import get_now
+from openprocurement.tender.openeu.design import sync_design, get_due_tenders
+
+SIZES = (1000, 10000, 100000)
+LIMIT = 100
+
+
+def fill(db, size, now):
+    """ stores tenders due within a year around now, across DST switches """
+    docs = []
+    for index in range(size):
+        next_check = now + timedelta(seconds=randint(-180 * 86400, 180 * 86400), microseconds=randint(0, 999999))
+        docs.append({
+            '_id': uuid4().hex,
+            'doc_type': 'Tender',
+            'procurementMethodType': 'aboveThresholdEU',
+            'next_check': next_check.isoformat(),
+        })
+        if len(docs) == 10000:
+            db.update(docs)
+            docs = []
+    if docs:
+        db.update(docs)
+
+
+def main():
+    server = Server(os.environ.get('COUCHDB_URL', 'http://localhost:5984'))
+    now = get_now()
+    for size in SIZES:
+        name = 'benchmark_due_tenders_{}'.format(uuid4().hex)
+        db = server.create(name)
+        try:
+            fill(db, size, now)
+            sync_design(db)
+            get_due_tenders(db, now, limit=1)  # builds the index
+            due = get_due_tenders(db, now, limit=LIMIT)
+            assert [i[1] for i in due] == sorted([i[1] for i in due])
+            assert all([i[1] <= now for i in due])
+            number = 10
+            elapsed = min(timeit.repeat(lambda: get_due_tenders(db, now, limit=LIMIT), number=number, repeat=3)) / number
+            print('{} tenders: first {} due in {:.6f}s'.format(size, LIMIT, elapsed))
+        finally:
+            del server[name]
+
+
+if __name__ == '__main__':
+    main()
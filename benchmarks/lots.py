@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+""" Number of bids of every lot: rescan of bids per lot against the lot index """
+from benchmarks.base import get_tender, fresh, compare
+
+
+def old_numberOfBids(tender, lot):
+    bids = [
+        bid
+        for bid in tender.bids
+        if lot.id in [i.relatedLot for i in bid.lotValues if i.status in ["active", "pending"]] and bid.status in ["active", "pending"]
+    ]
+    return len(bids)
+
+
+def main():
+    for bids, lots in [(100, 3), (500, 10), (1000, 20)]:
+        tender = get_tender(bids=bids, lots=lots, status='active.tendering')
+
+        def old():
+            return [old_numberOfBids(tender, lot) for lot in tender.lots]
+
+        def new():
+            fresh(tender)
+            return [lot.numberOfBids for lot in tender.lots]
+
+        assert old() == new()
+        compare('numberOfBids of {} lots, {} bids'.format(lots, bids), old, new)
+
+
+if __name__ == '__main__':
+    main()
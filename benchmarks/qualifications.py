@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+""" Qualifications of pre-qualification: appends with lot list lookups
+    against one batch built with a set of active lots
+"""
+from openprocurement.tender.openeu.models import Qualification
+from openprocurement.tender.openeu.utils import prepare_qualifications
+from benchmarks.base import get_tender, fresh, compare, Request
+
+
+def old_prepare_qualifications(request, bids=[], lotId=None):
+    new_qualifications = []
+    tender = request.validated['tender']
+    if not bids:
+        bids = tender.bids
+    if tender.lots:
+        active_lots = [lot.id for lot in tender.lots if lot.status == 'active']
+        for bid in bids:
+            if bid.status not in ['invalid', 'deleted']:
+                for lotValue in bid.lotValues:
+                    if lotValue.status == 'pending' and lotValue.relatedLot in active_lots:
+                        if lotId:
+                            if lotValue.relatedLot == lotId:
+                                qualification = Qualification({'bidID': bid.id, 'status': 'pending', 'lotID': lotId})
+                                tender.qualifications.append(qualification)
+                                new_qualifications.append(qualification.id)
+                        else:
+                            qualification = Qualification({'bidID': bid.id, 'status': 'pending', 'lotID': lotValue.relatedLot})
+                            tender.qualifications.append(qualification)
+                            new_qualifications.append(qualification.id)
+    else:
+        for bid in bids:
+            if bid.status == 'pending':
+                qualification = Qualification({'bidID': bid.id, 'status': 'pending'})
+                tender.qualifications.append(qualification)
+                new_qualifications.append(qualification.id)
+    return new_qualifications
+
+
+def main():
+    for bids, lots in [(500, 0), (500, 10), (1000, 20)]:
+        tender = get_tender(bids=bids, lots=lots, status='active.pre-qualification')
+        request = Request(tender)
+
+        def run(func):
+            def wrapper():
+                tender.qualifications = []
+                fresh(tender)
+                return func(request)
+            return wrapper
+
+        assert len(run(old_prepare_qualifications)()) == len(run(prepare_qualifications)())
+        compare('qualifications of {} bids, {} lots'.format(bids, lots),
+                run(old_prepare_qualifications), run(prepare_qualifications), number=3)
+
+
+if __name__ == '__main__':
+    main()
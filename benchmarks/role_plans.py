@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+""" Tender export with role plans against the default schematics export """
+from openprocurement.tender.openeu.models import (
+    ROLE_PLANS, Tender, Bid, Lot, LotAuctionPeriod, TenderAuctionPeriod,
+    Qualification, ConfidentialDocument, compile_role_plans,
+)
+from benchmarks.base import get_tender, fresh, compare
+
+
+def main():
+    compile_role_plans(Tender, Bid, Lot, LotAuctionPeriod, TenderAuctionPeriod, Qualification, ConfidentialDocument)
+    plans = dict(ROLE_PLANS)
+
+    # every tender status is exported with the role of the same name
+    statuses = [i for i in Tender._fields['status'].choices if i in Tender._options.roles]
+    for status in statuses:
+        tender = get_tender(bids=500, lots=3, awards=1, status=status)
+
+        def old():
+            # role without a plan is exported by schematics as before
+            ROLE_PLANS.update(dict.fromkeys(plans))
+            try:
+                fresh(tender)
+                return tender.serialize(status)
+            finally:
+                ROLE_PLANS.update(plans)
+
+        def new():
+            fresh(tender)
+            return tender.serialize(status)
+
+        assert old() == new()
+        compare('serialize 500 bids, 3 lots, {}'.format(status), old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,19 @@
-from openprocurement.tender.openeu.models import Tender
+from pyramid.events import ApplicationCreated
+from openprocurement.tender.openeu.design import sync_design_on_start
+from openprocurement.tender.openeu.models import (
+    Tender,
+    Bid,
+    Lot,
+    LotAuctionPeriod,
+    TenderAuctionPeriod,
+    Qualification,
+    ConfidentialDocument,
+    compile_role_plans,
+)
 
 
 def includeme(config):
     config.add_tender_procurementMethodType(Tender)
+    compile_role_plans(Tender, Bid, Lot, LotAuctionPeriod, TenderAuctionPeriod, Qualification, ConfidentialDocument)
     config.scan("openprocurement.tender.openeu.views")
+    config.add_subscriber(sync_design_on_start, ApplicationCreated)
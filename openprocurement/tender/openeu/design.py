@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from couchdb.design import ViewDefinition
+from iso8601 import parse_date
+from pytz import utc
+from openprocurement.api.models import TZ
+
+
+# next_check is stored in local time, keys are in UTC with microseconds,
+# so they are ordered as the moments they stand for
+tenders_by_next_check_view = ViewDefinition('tenders_eu', 'by_next_check', '''function(doc) {
+    if(doc.doc_type == 'Tender' && doc.procurementMethodType == 'aboveThresholdEU' && doc.next_check) {
+        var m = doc.next_check.match(/^(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2}):(\\d{2})(\\.\\d+)?(Z|([+-])(\\d{2}):(\\d{2}))?$/);
+        if(!m) {
+            return;
+        }
+        var time = Date.UTC(+m[1], m[2] - 1, +m[3], +m[4], +m[5], +m[6]);
+        if(m[9]) {
+            time -= (m[9] == '-' ? -1 : 1) * (m[10] * 60 + +m[11]) * 60000;
+        }
+        emit(new Date(time).toISOString().slice(0, 19) + ((m[7] || '.') + '000000').slice(0, 7) + 'Z', null);
+    }
+}''')
+
+
+# stores tender data sent without bids and sets statuses of the listed bids
+# in the stored document, so bids don't have to be sent to be invalidated
+bids_delta_update = '''function(doc, req) {
+    if (!doc) {
+        return [null, {code: 404, json: {error: 'not_found'}}];
+    }
+    var data = JSON.parse(req.body);
+    if (data._rev != doc._rev) {
+        return [null, {code: 409, json: {error: 'conflict', reason: 'Document update conflict.'}}];
+    }
+    var statuses = data.bids_statuses || {};
+    delete data.bids_statuses;
+    if (doc.bids) {
+        for (var i = 0; i < doc.bids.length; i++) {
+            if (statuses.hasOwnProperty(doc.bids[i].id)) {
+                doc.bids[i].status = statuses[doc.bids[i].id];
+            }
+        }
+        data.bids = doc.bids;
+    }
+    return [data, {json: {id: doc._id}}];
+}'''
+
+
+def sync_design(db):
+    views = [j for i, j in globals().items() if "_view" in i]
+    ViewDefinition.sync_many(db, views)
+    design = db.get('_design/tenders_eu')
+    updates = {'bids_delta': bids_delta_update}
+    if design.get('updates') != updates:
+        design['updates'] = updates
+        db.save(design)
+
+
+def sync_design_on_start(event):
+    db = getattr(event.app.registry, 'db', None)
+    if db is not None:
+        sync_design(db)
+
+
+def get_due_tenders(db, before, limit=None):
+    """ returns (tender id, next_check) pairs of EU tenders which are due to
+        be checked by chronograph not later than `before`, earliest first
+    """
+    options = {'endkey': before.astimezone(utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')}
+    if limit:
+        options['limit'] = limit
+    return [
+        (row.id, parse_date(row.key).astimezone(TZ))
+        for row in tenders_by_next_check_view(db, **options)
+    ]
@@ -1,12 +1,12 @@
 from uuid import uuid4
 from datetime import timedelta
-from iso8601 import parse_date
 from pyramid.security import Allow
+from repoze.lru import LRUCache
 from zope.interface import implementer
 from schematics.types import StringType, MD5Type, BooleanType
-from schematics.types.compound import ModelType
+from schematics.types.compound import ModelType, DictType
 from schematics.types.serializable import serializable
-from schematics.transforms import blacklist, whitelist
+from schematics.transforms import blacklist, whitelist, Role, to_primitive
 from schematics.exceptions import ValidationError
 from openprocurement.api.models import (
     ITender, TZ, Model, Address, Period, IsoDateTimeType, ListType,
@@ -23,7 +23,8 @@ from openprocurement.api.models import (
     validate_cpv_group, validate_items_uniq, rounding_shouldStartAfter,
 )
 from openprocurement.tender.openua.utils import (
-    calculate_business_date, BLOCK_COMPLAINT_STATUS,
+    calculate_business_date as base_calculate_business_date,
+    BLOCK_COMPLAINT_STATUS,
 )
 from openprocurement.tender.openua.models import (
     Complaint as BaseComplaint, Award as BaseAward, Item as BaseItem,
@@ -43,6 +44,41 @@ TENDERING_AUCTION = timedelta(days=35)
 QUESTIONS_STAND_STILL = timedelta(days=10)
 PREQUALIFICATION_COMPLAINT_STAND_STILL = timedelta(days=5)
 COMPLAINT_STAND_STILL = timedelta(days=10)
+BUSINESS_DATES = LRUCache(1024)
+
+
+def calculate_business_date(date_obj, timedelta_obj, context=None, working_days=False):
+    """ memoized calculate_business_date of openua
+
+        Result depends only on arguments and the accelerator set in
+        procurementMethodDetails of the context, so these are the cache key.
+        Timezone is a part of the key as equal moments in different zones
+        are equal datetimes. Dates counted from the current time never
+        repeat, so base_calculate_business_date is used for them instead.
+    """
+    details = context.get('procurementMethodDetails') if context else None
+    key = (date_obj, getattr(date_obj, 'tzinfo', None), timedelta_obj, bool(working_days), details)
+    value = BUSINESS_DATES.get(key)
+    if value is None:
+        value = base_calculate_business_date(date_obj, timedelta_obj, context, working_days)
+        BUSINESS_DATES.put(key, value)
+    return value
+
+
+def get_bids_validation_context(tender):
+    """ returns data shared by validators of all bids of the tender
+
+        It is built once for the tender instance, which lives for a single
+        request, so the request is inspected once instead of per field.
+    """
+    context = tender.__dict__.get('_bids_validation')
+    if context is None:
+        request = tender.__parent__.request
+        context = tender.__dict__['_bids_validation'] = {
+            # disable bids validation on tender PATCH requests as tender bids will be invalidated
+            'validate': not (request.method == "PATCH" and isinstance(tender, Tender) and request.authenticated_role == "tender_owner"),
+        }
+    return context
 
 
 def bids_validation_wrapper(validation_func):
@@ -50,15 +86,92 @@ def bids_validation_wrapper(validation_func):
         if data['status'] in ('deleted', 'invalid', 'draft'):
             # skip not valid bids
             return
-        tender = data['__parent__']
-        request = tender.__parent__.request
-        if request.method == "PATCH" and isinstance(tender, Tender) and request.authenticated_role == "tender_owner":
-            # disable bids validation on tender PATCH requests as tender bids will be invalidated
+        if not get_bids_validation_context(data['__parent__'])['validate']:
             return
         return validation_func(klass, data, value)
     return validator
 
 
+def invalidate_tender_cache(model, indexes=True):
+    """ drops derived data cached on the tender the model belongs to
+
+        Indexes by ids are kept when only statuses are changed.
+    """
+    while model is not None and not isinstance(model, Tender):
+        model = getattr(model, '__parent__', None)
+    if model is not None:
+        model.__dict__.pop('_tender_cache', None)
+        model.__dict__.pop('_tender_memo', None)
+        if indexes:
+            model.__dict__.pop('_tender_index', None)
+
+
+ROLE_PLANS = {}
+
+
+def get_role_plan(cls, role):
+    """ returns names of fields and serializable fields visible for the role
+
+        None is returned when the role isn't defined by the model itself,
+        so the default export is used.
+    """
+    key = (cls, role)
+    if key not in ROLE_PLANS:
+        roles = getattr(getattr(cls, '_options', None), 'roles', {})
+        gottago = roles.get(role)
+        if not isinstance(gottago, Role):
+            ROLE_PLANS[key] = None
+        else:
+            ROLE_PLANS[key] = (
+                tuple([name for name in cls._fields if not gottago(name, None)]),
+                tuple([
+                    name
+                    for name, field in cls._serializables.items()
+                    if not gottago(name, None) or not gottago(field.serialized_name or name, None)
+                ])
+            )
+    return ROLE_PLANS[key]
+
+
+def compile_role_plans(*classes):
+    """ computes plans for all roles of the models ahead of requests """
+    for cls in classes:
+        for role in cls._options.roles:
+            get_role_plan(cls, role)
+
+
+def get_plan_data(model_instance, plan):
+    """ returns dict with values of the model visible by the role plan
+
+        Export loop reads every field and serializable field by name, so
+        hidden ones are kept as None and are dropped by the role later.
+    """
+    cls = type(model_instance)
+    fields, serializables = plan
+    data = dict.fromkeys(cls._fields)
+    data.update(dict.fromkeys(cls._serializables))
+    for name in fields:
+        data[name] = model_instance._data.get(name)
+    for name in serializables:
+        data[name] = getattr(model_instance, name)
+    return data
+
+
+class RoleModelType(ModelType):
+    """ ModelType exporting only fields visible for the role
+
+        Values of hidden fields aren't read and hidden serializable fields
+        aren't computed.
+    """
+
+    def export_loop(self, model_instance, field_converter, role=None, print_none=False):
+        if type(model_instance) is self.model_class and role is not None:
+            plan = get_role_plan(self.model_class, role)
+            if plan is not None:
+                model_instance = get_plan_data(model_instance, plan)
+        return super(RoleModelType, self).export_loop(model_instance, field_converter, role=role, print_none=print_none)
+
+
 class ComplaintModelType(BaseComplaintModelType):
     view_claim_statuses = ['active.tendering', 'active.pre-qualification', 'active.pre-qualification.stand-still', 'active.auction']
 
@@ -175,6 +288,12 @@ class TenderAuctionPeriod(Period):
 
     @serializable(serialize_when_none=False)
     def shouldStartAfter(self):
+        start_after = self.should_start_after()
+        if start_after:
+            return start_after.isoformat()
+
+    def should_start_after(self):
+        """ datetime value of shouldStartAfter """
         if self.endDate:
             return
         tender = self.__parent__
@@ -182,13 +301,13 @@ class TenderAuctionPeriod(Period):
             return
         start_after = None
         if tender.status == 'active.tendering' and tender.tenderPeriod.endDate:
-            start_after = calculate_business_date(tender.tenderPeriod.endDate, TENDERING_AUCTION, tender)
+            return tender.auction_start_baseline()
         elif self.startDate and get_now() > calc_auction_end_time(tender.numberOfBids, self.startDate):
             start_after = calc_auction_end_time(tender.numberOfBids, self.startDate)
         elif tender.qualificationPeriod and tender.qualificationPeriod.endDate:
             start_after = tender.qualificationPeriod.endDate
         if start_after:
-            return rounding_shouldStartAfter(start_after, tender).isoformat()
+            return rounding_shouldStartAfter(start_after, tender)
 
 
 class LotAuctionPeriod(Period):
@@ -196,6 +315,12 @@ class LotAuctionPeriod(Period):
 
     @serializable(serialize_when_none=False)
     def shouldStartAfter(self):
+        start_after = self.should_start_after()
+        if start_after:
+            return start_after.isoformat()
+
+    def should_start_after(self):
+        """ datetime value of shouldStartAfter """
         if self.endDate:
             return
         tender = get_tender(self)
@@ -204,13 +329,13 @@ class LotAuctionPeriod(Period):
             return
         start_after = None
         if tender.status == 'active.tendering' and tender.tenderPeriod.endDate:
-            start_after = calculate_business_date(tender.tenderPeriod.endDate, TENDERING_AUCTION, tender)
+            return tender.auction_start_baseline()
         elif self.startDate and get_now() > calc_auction_end_time(lot.numberOfBids, self.startDate):
             start_after = calc_auction_end_time(lot.numberOfBids, self.startDate)
         elif tender.qualificationPeriod and tender.qualificationPeriod.endDate:
             start_after = tender.qualificationPeriod.endDate
         if start_after:
-            return rounding_shouldStartAfter(start_after, tender).isoformat()
+            return rounding_shouldStartAfter(start_after, tender)
 
 
 class Lot(BaseLot):
@@ -228,17 +353,17 @@ class Lot(BaseLot):
             'chronograph_view': whitelist('id', 'auctionPeriod', 'numberOfBids', 'status'),
         }
 
-    auctionPeriod = ModelType(LotAuctionPeriod, default={})
+    auctionPeriod = RoleModelType(LotAuctionPeriod, default={})
+
+    def __setattr__(self, name, value):
+        super(Lot, self).__setattr__(name, value)
+        if name == 'status':
+            invalidate_tender_cache(self, indexes=False)
 
     @serializable
     def numberOfBids(self):
         """A property that is serialized by schematics exports."""
-        bids = [
-            bid
-            for bid in self.__parent__.bids
-            if self.id in [i.relatedLot for i in bid.lotValues if i.status in ["active", "pending"]] and bid.status in ["active", "pending"]
-        ]
-        return len(bids)
+        return self.__parent__.lots_numberOfBids().get(self.id, 0)
 
 
 class LotValue(BaseLotValue):
@@ -253,12 +378,16 @@ class LotValue(BaseLotValue):
     status = StringType(choices=['pending', 'active', 'unsuccessful'],
                         default='pending')
 
+    def __setattr__(self, name, value):
+        super(LotValue, self).__setattr__(name, value)
+        if name in ('status', 'relatedLot'):
+            invalidate_tender_cache(self, indexes=name != 'status')
+
     def validate_value(self, data, value):
         if value and isinstance(data['__parent__'], Model) and (data['__parent__'].status not in ('invalid', 'deleted')) and data['relatedLot']:
-            lots = [i for i in get_tender(data['__parent__']).lots if i.id == data['relatedLot']]
-            if not lots:
+            lot = get_tender(data['__parent__']).lots_by_id().get(data['relatedLot'])
+            if lot is None:
                 return
-            lot = lots[0]
             if lot.value.amount < value.amount:
                 raise ValidationError(u"value of bid should be less than value of lot")
             if lot.get('value').currency != value.currency:
@@ -267,7 +396,7 @@ class LotValue(BaseLotValue):
                 raise ValidationError(u"valueAddedTaxIncluded of bid should be identical to valueAddedTaxIncluded of value of lot")
 
     def validate_relatedLot(self, data, relatedLot):
-        if isinstance(data['__parent__'], Model) and (data['__parent__'].status not in ('invalid', 'deleted')) and relatedLot not in [i.id for i in get_tender(data['__parent__']).lots]:
+        if isinstance(data['__parent__'], Model) and (data['__parent__'].status not in ('invalid', 'deleted')) and relatedLot not in get_tender(data['__parent__']).lots_by_id():
             raise ValidationError(u"relatedLot should be one of lots")
 
 
@@ -296,10 +425,10 @@ class Bid(BaseBid):
             'invalid': whitelist('id', 'status'),
             'deleted': whitelist('id', 'status'),
         }
-    documents = ListType(ModelType(ConfidentialDocument), default=list())
-    financialDocuments = ListType(ModelType(ConfidentialDocument), default=list())
-    eligibilityDocuments = ListType(ModelType(ConfidentialDocument), default=list())
-    qualificationDocuments = ListType(ModelType(ConfidentialDocument), default=list())
+    documents = ListType(RoleModelType(ConfidentialDocument), default=list())
+    financialDocuments = ListType(RoleModelType(ConfidentialDocument), default=list())
+    eligibilityDocuments = ListType(RoleModelType(ConfidentialDocument), default=list())
+    qualificationDocuments = ListType(RoleModelType(ConfidentialDocument), default=list())
     lotValues = ListType(ModelType(LotValue), default=list())
     selfQualified = BooleanType(required=True, choices=[True])
     selfEligible = BooleanType(required=True, choices=[True])
@@ -307,6 +436,16 @@ class Bid(BaseBid):
     status = StringType(choices=['draft','pending', 'active', 'invalid', 'unsuccessful', 'deleted'],
                         default='pending')
 
+    def __setattr__(self, name, value):
+        super(Bid, self).__setattr__(name, value)
+        if name in ('status', 'lotValues', 'owner', 'owner_token'):
+            invalidate_tender_cache(self, indexes=name == 'lotValues')
+
+    def import_data(self, raw_data, *args, **kw):
+        model = super(Bid, self).import_data(raw_data, *args, **kw)
+        invalidate_tender_cache(self)
+        return model
+
     def serialize(self, role=None):
         if role and role != 'create' and self.status in ['invalid', 'deleted']:
             role = self.status
@@ -319,12 +458,13 @@ class Bid(BaseBid):
         if self.status in ['draft', 'invalid', 'deleted'] or self.__parent__.status in ['active.tendering', 'cancelled']:
             return self.status
         if self.__parent__.lots:
-            active_lots = [lot.id for lot in self.__parent__.lots if lot.status in ('active', 'complete',)]
+            lots_statuses = self.__parent__.lots_statuses()
+            lotValues = [i for i in self.lotValues if lots_statuses.get(i.relatedLot) in ('active', 'complete',)]
             if not self.lotValues:
                 return 'invalid'
-            elif [i.relatedLot for i in self.lotValues if i.status == 'pending' and i.relatedLot in active_lots]:
+            elif [i.relatedLot for i in lotValues if i.status == 'pending']:
                 return 'pending'
-            elif [i.relatedLot for i in self.lotValues if i.status == 'active' and i.relatedLot in active_lots]:
+            elif [i.relatedLot for i in lotValues if i.status == 'active']:
                 return 'active'
             else:
                 return 'unsuccessful'
@@ -365,6 +505,25 @@ class Award(BaseAward):
         pass
 
 
+class AwardRanking(Model):
+    """ ranking of bids computed by chef for awarding """
+    fingerprint = MD5Type(required=True)  # hash of the ranked data
+    bids = ListType(StringType(), default=list())  # ids of bids, best first
+
+
+class StoredDictType(DictType):
+    """ DictType stored in the database, but not exported for roles
+
+        Documents are stored with the default export, while responses,
+        input data and revision snapshots are exported for roles.
+    """
+
+    def export_loop(self, dict_instance, field_converter, role=None, print_none=False):
+        if role is not None:
+            return
+        return super(StoredDictType, self).export_loop(dict_instance, field_converter, role=role, print_none=print_none)
+
+
 class Qualification(Model):
     """ Pre-Qualification """
 
@@ -405,7 +564,7 @@ class Qualification(Model):
         if isinstance(data['__parent__'], Model):
             if not lotID and data['__parent__'].lots:
                 raise ValidationError(u'This field is required.')
-            if lotID and lotID not in [i.id for i in data['__parent__'].lots]:
+            if lotID and lotID not in data['__parent__'].lots_ids():
                 raise ValidationError(u"lotID should be one of lots")
 
 
@@ -415,6 +574,7 @@ class Tender(BaseTender):
     class Options:
         roles = {
             'plain': plain_role,
+            'without_bids': schematics_default_role + blacklist('bids'),
             'create': create_role_eu,
             'edit': edit_role_eu,
             'edit_draft': edit_role_eu,
@@ -454,7 +614,7 @@ class Tender(BaseTender):
 
     enquiryPeriod = ModelType(EnquiryPeriod, required=False)
     tenderPeriod = ModelType(PeriodStartEndRequired, required=True)
-    auctionPeriod = ModelType(TenderAuctionPeriod, default={})
+    auctionPeriod = RoleModelType(TenderAuctionPeriod, default={})
     documents = ListType(ModelType(Document), default=list())  # All documents and attachments related to the tender.
     items = ListType(ModelType(Item), required=True, min_size=1, validators=[validate_cpv_group, validate_items_uniq])  # The goods and services to be purchased, broken into line items wherever possible. Items should not be duplicated, but a quantity of 2 specified instead.
     complaints = ListType(ComplaintModelType(Complaint), default=list())
@@ -462,10 +622,11 @@ class Tender(BaseTender):
     cancellations = ListType(ModelType(Cancellation), default=list())
     awards = ListType(ModelType(Award), default=list())
     procuringEntity = ModelType(ProcuringEntity, required=True)  # The entity managing the procurement, which may be different from the buyer who is paying / using the items being procured.
-    bids = SifterListType(ModelType(Bid), default=list(), filter_by='status', filter_in_values=['invalid', 'deleted'])  # A list of all the companies who entered submissions for the tender.
-    qualifications = ListType(ModelType(Qualification), default=list())
+    bids = SifterListType(RoleModelType(Bid), default=list(), filter_by='status', filter_in_values=['invalid', 'deleted'])  # A list of all the companies who entered submissions for the tender.
+    qualifications = ListType(RoleModelType(Qualification), default=list())
     qualificationPeriod = ModelType(Period)
-    lots = ListType(ModelType(Lot), default=list(), validators=[validate_lots_uniq])
+    lots = ListType(RoleModelType(Lot), default=list(), validators=[validate_lots_uniq])
+    awardRankings = StoredDictType(ModelType(AwardRanking))  # lot id or 'tender' -> ranking of bids
     status = StringType(choices=['draft', 'active.tendering', 'active.pre-qualification', 'active.pre-qualification.stand-still', 'active.auction',
                                  'active.qualification', 'active.awarded', 'complete', 'cancelled', 'unsuccessful'], default='active.tendering')
 
@@ -474,16 +635,17 @@ class Tender(BaseTender):
     procuring_entity_kinds = ['general', 'special', 'defense']
 
     def __acl__(self):
-        acl = [
-            (Allow, '{}_{}'.format(i.owner, i.owner_token), 'create_qualification_complaint')
-            for i in self.bids
-            if i.status in ['active', 'unsuccessful']
-        ]
-        acl.extend([
-            (Allow, '{}_{}'.format(i.owner, i.owner_token), 'create_award_complaint')
-            for i in self.bids
-            if i.status == 'active'
-        ])
+        return self.get_cached('acl', self.bids, self.build_acl)
+
+    def build_acl(self):
+        acl = []
+        for i in self.bids:
+            if i.status not in ['active', 'unsuccessful']:
+                continue
+            bid_owner = '{}_{}'.format(i.owner, i.owner_token)
+            acl.append((Allow, bid_owner, 'create_qualification_complaint'))
+            if i.status == 'active':
+                acl.append((Allow, bid_owner, 'create_award_complaint'))
         acl.extend([
             (Allow, '{}_{}'.format(self.owner, self.owner_token), 'edit_tender'),
             (Allow, '{}_{}'.format(self.owner, self.owner_token), 'upload_tender_documents'),
@@ -491,6 +653,134 @@ class Tender(BaseTender):
         ])
         return acl
 
+    def __init__(self, raw_data=None, *args, **kwargs):
+        super(Tender, self).__init__(raw_data, *args, **kwargs)
+        # next_check persisted by the last write of the tender
+        self._stored_next_check = raw_data.get('next_check') if isinstance(raw_data, dict) else None
+
+    def __setattr__(self, name, value):
+        super(Tender, self).__setattr__(name, value)
+        if name in ('bids', 'owner', 'owner_token'):
+            invalidate_tender_cache(self)
+        elif not name.startswith('_'):
+            self.__dict__.pop('_tender_memo', None)
+
+    def import_data(self, raw_data, *args, **kw):
+        model = super(Tender, self).import_data(raw_data, *args, **kw)
+        invalidate_tender_cache(self)
+        return model
+
+    def get_cached(self, name, source, build, store='_tender_cache'):
+        """ returns data derived from the source list
+
+            Data is built once per tender load and rebuilt when the list is
+            replaced or extended or when the cache is invalidated by changes
+            of bids.
+        """
+        cache = self.__dict__.setdefault(store, {})
+        entry = cache.get(name)
+        if entry is None or entry[0] is not source or entry[1] != len(source):
+            entry = cache[name] = (source, len(source), build())
+        return entry[2]
+
+    def get_memoized(self, name, key, build):
+        """ returns value of the derived field computed once per request
+
+            Value is computed again when the key changes or the tender is
+            changed.
+        """
+        memo = self.__dict__.setdefault('_tender_memo', {})
+        entry = memo.get(name)
+        if entry is None or entry[0] != key:
+            entry = memo[name] = (key, build())
+        return entry[1]
+
+    def serialize(self, role=None, context=None):
+        if role == 'plain':
+            # plain snapshots are taken before and after changes,
+            # so derived fields are always computed anew for them
+            self.__dict__.pop('_tender_memo', None)
+        plan = get_role_plan(type(self), role) if role is not None else None
+        if plan is not None:
+            return to_primitive(type(self), get_plan_data(self, plan), role=role, context=context)
+        return super(Tender, self).serialize(role=role, context=context)
+
+    def store(self, db, *args, **kwargs):
+        """ saves the tender to the database
+
+            When statuses of bids are given by save_tender_bids_delta, the
+            tender is sent without bids to the `bids_delta` update handler.
+            When the batch chronograph gives a list of documents, the tender
+            is only validated and added to it to be saved in bulk.
+        """
+        bulk_docs = self.__dict__.get('_bulk_docs')
+        if bulk_docs is not None:
+            self.validate()
+            bulk_docs.append(self.to_primitive())
+            return self
+        bids_statuses = self.__dict__.get('_bids_statuses')
+        if bids_statuses is None:
+            return super(Tender, self).store(db, *args, **kwargs)
+        self.validate()
+        data = self.serialize('without_bids')
+        data['bids_statuses'] = bids_statuses
+        headers, body = db.update_doc('tenders_eu/bids_delta', self.id, body=data)
+        self._rev = headers['X-Couch-Update-NewRev']
+        return self
+
+    def lots_ids(self):
+        """ set of ids of tender lots """
+        return self.get_cached('lots_ids', self.lots, lambda: set([i.id for i in self.lots]), '_tender_index')
+
+    def lots_by_id(self):
+        """ tender lots by their ids """
+        return self.get_cached('lots_by_id', self.lots, lambda: dict([(i.id, i) for i in self.lots]), '_tender_index')
+
+    def bids_index(self):
+        """ bid id -> bid and (bid id, lot id) -> (bid, lot value) """
+        def build():
+            index = {}
+            for bid in self.bids:
+                index[bid.id] = bid
+                for lotValue in bid.lotValues:
+                    index[(bid.id, lotValue.relatedLot)] = (bid, lotValue)
+            return index
+        return self.get_cached('bids_index', self.bids, build, '_tender_index')
+
+    def awards_by_bid(self):
+        """ bid id -> list of awards of the bid """
+        def build():
+            index = {}
+            for award in self.awards:
+                index.setdefault(award.bid_id, []).append(award)
+            return index
+        return self.get_cached('awards_by_bid', self.awards, build, '_tender_index')
+
+    def awards_by_lot(self):
+        """ lot id -> list of awards of the lot in order of creation """
+        def build():
+            index = {}
+            for award in self.awards:
+                index.setdefault(award.lotID, []).append(award)
+            return index
+        return self.get_cached('awards_by_lot', self.awards, build, '_tender_index')
+
+    def lots_statuses(self):
+        """ lot id -> status of the lot """
+        return self.get_cached('lots_statuses', self.lots, lambda: dict([(i.id, i.status) for i in self.lots]))
+
+    def lots_numberOfBids(self):
+        """ lot id -> number of active and pending bids of the lot """
+        def build():
+            counts = {}
+            for bid in self.bids:
+                if bid.status not in ("active", "pending"):
+                    continue
+                for lot_id in set([i.relatedLot for i in bid.lotValues if i.status in ("active", "pending")]):
+                    counts[lot_id] = counts.get(lot_id, 0) + 1
+            return counts
+        return self.get_cached('lots_numberOfBids', self.bids, build)
+
     def initialize(self):
         endDate = calculate_business_date(self.tenderPeriod.endDate, -QUESTIONS_STAND_STILL, self)
         self.enquiryPeriod = EnquiryPeriod(dict(startDate=self.tenderPeriod.startDate,
@@ -500,19 +790,64 @@ class Tender(BaseTender):
 
     @serializable(serialized_name="enquiryPeriod", type=ModelType(EnquiryPeriod))
     def tender_enquiryPeriod(self):
-        endDate = calculate_business_date(self.tenderPeriod.endDate, -QUESTIONS_STAND_STILL, self)
-        return EnquiryPeriod(dict(startDate=self.tenderPeriod.startDate,
-                                  endDate=endDate,
-                                  invalidationDate=self.enquiryPeriod and self.enquiryPeriod.invalidationDate,
-                                  clarificationsUntil=calculate_business_date(endDate, ENQUIRY_STAND_STILL_TIME, self, True)))
+        invalidationDate = self.enquiryPeriod and self.enquiryPeriod.invalidationDate
+        key = (self.tenderPeriod.startDate, self.tenderPeriod.endDate, invalidationDate, self.get('procurementMethodDetails'))
+
+        def build():
+            endDate = calculate_business_date(self.tenderPeriod.endDate, -QUESTIONS_STAND_STILL, self)
+            return EnquiryPeriod(dict(startDate=self.tenderPeriod.startDate,
+                                      endDate=endDate,
+                                      invalidationDate=invalidationDate,
+                                      clarificationsUntil=calculate_business_date(endDate, ENQUIRY_STAND_STILL_TIME, self, True)))
+        return self.get_memoized('enquiryPeriod', key, build)
 
     @serializable(type=ModelType(Period))
     def complaintPeriod(self):
-        return Period(dict(startDate=self.tenderPeriod.startDate,
-                           endDate=calculate_business_date(self.tenderPeriod.endDate, -COMPLAINT_SUBMIT_TIME, self)))
+        key = (self.tenderPeriod.startDate, self.tenderPeriod.endDate, self.get('procurementMethodDetails'))
+        return self.get_memoized('complaintPeriod', key, lambda: Period(dict(
+            startDate=self.tenderPeriod.startDate,
+            endDate=calculate_business_date(self.tenderPeriod.endDate, -COMPLAINT_SUBMIT_TIME, self))))
 
     @serializable(serialize_when_none=False)
     def next_check(self):
+        """ time of the next chronograph check
+
+            It's computed on writes only and is stored with the tender,
+            read requests return the stored value.
+        """
+        request = getattr(self.__parent__, 'request', None)
+        if self.get('_rev') and request is not None and request.method in ('GET', 'HEAD'):
+            return self._stored_next_check
+        return self.get_memoized('next_check', self.next_check_key(), self.calculate_next_check)
+
+    def next_check_key(self):
+        """ data of the tender next_check is calculated from
+
+            Changes of complaints, answers, awards and auction periods don't
+            change the tender revision or status within a request, so data
+            read by calculate_next_check for the status is the key.
+        """
+        if self.status == 'active.tendering':
+            return (self.status, self.tenderPeriod.endDate,
+                    tuple([i.status for i in self.complaints]),
+                    tuple([bool(i.answer) for i in self.questions]))
+        elif self.status == 'active.pre-qualification.stand-still':
+            return (self.status, self.qualificationPeriod and self.qualificationPeriod.endDate,
+                    tuple([i.status for q in self.qualifications for i in q.complaints]))
+        elif self.status == 'active.auction':
+            return (self.status, self.numberOfBids,
+                    self.auctionPeriod and (self.auctionPeriod.startDate, self.auctionPeriod.endDate),
+                    tuple([
+                        (i.status, i.numberOfBids, i.auctionPeriod and (i.auctionPeriod.startDate, i.auctionPeriod.endDate))
+                        for i in self.lots
+                    ]))
+        elif self.status in ['active.qualification', 'active.awarded']:
+            return (self.status,
+                    tuple([(i.lotID, i.complaintPeriod.endDate) for i in self.awards]),
+                    tuple([i.status for i in self.lots]))
+        return self.status
+
+    def calculate_next_check(self):
         now = get_now()
         checks = []
         if self.status == 'active.tendering' and self.tenderPeriod.endDate and \
@@ -550,10 +885,11 @@ class Tender(BaseTender):
                     checks.append(standStillEnd)
         elif self.lots and self.status in ['active.qualification', 'active.awarded']:
             lots_ends = []
+            awards_by_lot = self.awards_by_lot()
             for lot in self.lots:
                 if lot['status'] != 'active':
                     continue
-                lot_awards = [i for i in self.awards if i.lotID == lot.id]
+                lot_awards = awards_by_lot.get(lot.id, [])
                 standStillEnds = [
                     a.complaintPeriod.endDate.astimezone(TZ)
                     for a in lot_awards
@@ -570,7 +906,7 @@ class Tender(BaseTender):
 
     def validate_tenderPeriod(self, data, period):
         # if data['_rev'] is None when tender was created just now
-        if not data['_rev'] and calculate_business_date(get_now(), -timedelta(minutes=10)) >= period.startDate:
+        if not data['_rev'] and base_calculate_business_date(get_now(), -timedelta(minutes=10)) >= period.startDate:
             raise ValidationError(u"tenderPeriod.startDate should be in greater than current date")
         if period and calculate_business_date(period.startDate, TENDERING_DURATION, data) > period.endDate:
             raise ValidationError(u"tenderPeriod should be greater than {} days".format(TENDERING_DAYS))
@@ -578,20 +914,37 @@ class Tender(BaseTender):
     @serializable
     def numberOfBids(self):
         """A property that is serialized by schematics exports."""
-        return len([bid for bid in self.bids if bid.status in ("active", "pending",)])
+        return self.get_cached('numberOfBids', self.bids, lambda: len([bid for bid in self.bids if bid.status in ("active", "pending",)]))
+
+    def auction_start_baseline(self):
+        """ rounded date auctions should start after while tendering
+
+            It is the same for the tender and all its lots, so it is
+            computed once per request.
+        """
+        key = (self.tenderPeriod.endDate, self.enquiryPeriod and self.enquiryPeriod.startDate,
+               self.procurementMethodDetails, self.submissionMethodDetails)
+        return self.get_memoized('auction_start_baseline', key, lambda: rounding_shouldStartAfter(
+            calculate_business_date(self.tenderPeriod.endDate, TENDERING_AUCTION, self), self))
 
     def check_auction_time(self):
-        if self.auctionPeriod and self.auctionPeriod.startDate and self.auctionPeriod.shouldStartAfter \
-                and self.auctionPeriod.startDate > calculate_business_date(parse_date(self.auctionPeriod.shouldStartAfter), AUCTION_PERIOD_TIME, self, True):
+        start_after = self.auctionPeriod and self.auctionPeriod.startDate and self.auctionPeriod.should_start_after()
+        if start_after and self.auctionPeriod.startDate > calculate_business_date(start_after, AUCTION_PERIOD_TIME, self, True):
             self.auctionPeriod.startDate = None
         for lot in self.lots:
-            if lot.auctionPeriod and lot.auctionPeriod.startDate and lot.auctionPeriod.shouldStartAfter \
-                    and lot.auctionPeriod.startDate > calculate_business_date(parse_date(lot.auctionPeriod.shouldStartAfter), AUCTION_PERIOD_TIME, self, True):
+            start_after = lot.auctionPeriod and lot.auctionPeriod.startDate and lot.auctionPeriod.should_start_after()
+            if start_after and lot.auctionPeriod.startDate > calculate_business_date(start_after, AUCTION_PERIOD_TIME, self, True):
                 lot.auctionPeriod.startDate = None
 
     def invalidate_bids_data(self):
+        """ invalidates bids after changes of the tender by its owner
+
+            Only bids whose status actually changes are touched, these are
+            returned.
+        """
         self.check_auction_time()
         self.enquiryPeriod.invalidationDate = get_now()
-        for bid in self.bids:
-            if bid.status not in ["deleted", "draft"]:
-                bid.status = "invalid"
+        changed = [bid for bid in self.bids if bid.status not in ["deleted", "draft", "invalid"]]
+        for bid in changed:
+            bid.status = "invalid"
+        return changed
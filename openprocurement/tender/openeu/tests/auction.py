@@ -186,6 +186,11 @@ class TenderAuctionResourceTest(BaseTenderContentWebTest):
         self.assertEqual(tender["awards"][0]['bid_id'], patch_data["bids"][0]['id'])
         self.assertEqual(tender["awards"][0]['value']['amount'], patch_data["bids"][0]['value']['amount'])
         self.assertEqual(tender["awards"][0]['suppliers'], self.initial_bids[0]['tenderers'])
+        # ranking is stored for next awards, but isn't shown
+        self.assertNotIn('awardRankings', tender)
+        ranking = self.db.get(self.tender_id)['awardRankings']['tender']
+        self.assertEqual(ranking['bids'][0], patch_data["bids"][0]['id'])
+        self.assertEqual(len(ranking['bids']), len(self.initial_bids))
 
         response = self.app.post_json('/tenders/{}/auction'.format(self.tender_id), {'data': patch_data}, status=403)
         self.assertEqual(response.status, '403 Forbidden')
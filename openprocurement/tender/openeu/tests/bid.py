@@ -716,6 +716,12 @@ class TenderBidResourceTest(BaseTenderContentWebTest):
         self.assertTrue('tenderers' in bid_data)
         self.assertTrue('date' in bid_data)
 
+        response = self.app.get('/tenders/{}/bids?opt_pretty=1'.format(self.tender_id))
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertIn('{\n    "', response.body)
+        self.assertEqual(response.json['data'][0], bid_data)
+
         response = self.app.get('/tenders/some_id/bids', status=404)
         self.assertEqual(response.status, '404 Not Found')
         self.assertEqual(response.content_type, 'application/json')
@@ -725,6 +731,39 @@ class TenderBidResourceTest(BaseTenderContentWebTest):
                 u'url', u'name': u'tender_id'}
         ])
 
+    def test_get_tender_with_bids_in_all_statuses(self):
+        bids_statuses = ['draft', 'pending', 'active', 'invalid', 'unsuccessful', 'deleted']
+        for amount in range(len(bids_statuses)):
+            response = self.app.post_json('/tenders/{}/bids'.format(
+                self.tender_id), {'data': {'selfEligible': True, 'selfQualified': True,
+                                           'tenderers': test_bids[0]['tenderers'], "value": {"amount": 400 + amount}}})
+            self.assertEqual(response.status, '201 Created')
+        tender = self.db.get(self.tender_id)
+        for bid, status in zip(tender['bids'], bids_statuses):
+            bid['status'] = status
+        self.db.save(tender)
+
+        for status in ['active.tendering', 'active.pre-qualification', 'active.pre-qualification.stand-still',
+                       'active.auction', 'active.qualification', 'active.awarded', 'complete', 'unsuccessful',
+                       'cancelled']:
+            self.set_status(status)
+            response = self.app.get('/tenders/{}'.format(self.tender_id))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual(response.content_type, 'application/json')
+            self.assertEqual(response.json['data']['status'], status)
+            if status == 'active.tendering':
+                self.assertNotIn('bids', response.json['data'])
+                continue
+            bids = dict([(i['status'], i) for i in response.json['data']['bids']])
+            self.assertEqual(set(bids), set(bids_statuses))
+            self.assertEqual(set(bids['invalid']), set(['id', 'status']))
+            self.assertEqual(set(bids['deleted']), set(['id', 'status']))
+            if status in ['active.pre-qualification', 'active.pre-qualification.stand-still', 'active.auction']:
+                self.assertTrue(set(bids['pending']) <= set(['id', 'status', 'documents', 'tenderers']))
+            else:
+                self.assertIn('value', bids['active'])
+                self.assertIn('date', bids['active'])
+
     def test_bid_Administrator_change(self):
         response = self.app.post_json('/tenders/{}/bids'.format(
             self.tender_id), {'data': {'selfEligible': True, 'selfQualified': True,
@@ -774,6 +813,26 @@ class TenderBidResourceTest(BaseTenderContentWebTest):
             response = self.app.get('/tenders/{}/bids/{}?acc_token={}'.format(self.tender_id, bid_id, token))
             self.assertEqual(response.status, '200 OK')
             self.assertEqual(response.json['data']['status'], 'invalid')
+        # only statuses of invalidated bids are in the revision
+        tender = self.db.get(self.tender_id)
+        bids_changes = [i for i in tender['revisions'][-1]['changes'] if i['path'].startswith('/bids')]
+        self.assertEqual(sorted([i['path'] for i in bids_changes]),
+                         ['/bids/{}/status'.format(i) for i in range(len(bids_access))])
+        self.assertEqual(set([i['value'] for i in bids_changes]), set(['pending']))
+        self.assertEqual(set([i['status'] for i in tender['bids']]), set(['invalid']))
+        self.assertEqual(tender['value']['amount'], 300)
+        # already invalid bids aren't changed again
+        response = self.app.patch_json('/tenders/{}?acc_token={}'.format(self.tender_id, self.tender_token), {"data":
+                {"value": {'amount': 310.0}}
+        })
+        self.assertEqual(response.status, '200 OK')
+        tender = self.db.get(self.tender_id)
+        self.assertEqual([i for i in tender['revisions'][-1]['changes'] if i['path'].startswith('/bids')], [])
+        self.assertEqual(tender['value']['amount'], 310)
+        response = self.app.patch_json('/tenders/{}?acc_token={}'.format(self.tender_id, self.tender_token), {"data":
+                {"value": {'amount': 300.0}}
+        })
+        self.assertEqual(response.status, '200 OK')
         # try to add documents to bid
         for doc_resource in ['documents', 'financial_documents', 'eligibility_documents', 'qualification_documents']:
             response = self.app.post('/tenders/{}/bids/{}/{}?acc_token={}'.format(
@@ -884,6 +943,29 @@ class TenderBidResourceTest(BaseTenderContentWebTest):
                 self.assertTrue('tenderers' in bid)
                 self.assertTrue('date' in bid)
 
+    def test_tender_change_with_bids_is_saved(self):
+        response = self.app.post_json('/tenders/{}/bids'.format(self.tender_id), {'data': test_bids[0]})
+        self.assertEqual(response.status, '201 Created')
+        bid_id = response.json['data']['id']
+        bid_token = response.json['access']['token']
+
+        response = self.app.patch_json('/tenders/{}?acc_token={}'.format(self.tender_id, self.tender_token), {"data":
+                {"title": u"Новий заголовок", "value": {'amount': 300.0}}
+        })
+        self.assertEqual(response.status, '200 OK')
+        dateModified = response.json['data']['dateModified']
+
+        response = self.app.get('/tenders/{}'.format(self.tender_id))
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data']['title'], u"Новий заголовок")
+        self.assertEqual(response.json['data']['value']['amount'], 300)
+        self.assertEqual(response.json['data']['dateModified'], dateModified)
+
+        response = self.app.get('/tenders/{}/bids/{}?acc_token={}'.format(self.tender_id, bid_id, bid_token))
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data']['status'], 'invalid')
+        self.assertEqual(response.json['data']['tenderers'][0]['identifier']['id'], test_bids[0]['tenderers'][0]['identifier']['id'])
+
     def test_bids_activation_on_tender_documents(self):
         bids_access = {}
 
@@ -1651,6 +1733,45 @@ class TenderBidDocumentResourceTest(BaseTenderContentWebTest):
             self.assertEqual(response.content_type, 'application/json')
             self.assertEqual(response.json['errors'][0]["description"], "Can't add document in current (complete) tender status")
 
+    def test_get_tender_bidder_documents_paging(self):
+        for doc_resource in ['documents', 'financial_documents', 'eligibility_documents', 'qualification_documents']:
+            doc_ids = []
+            for i in range(3):
+                response = self.app.post('/tenders/{}/bids/{}/{}?acc_token={}'.format(
+                    self.tender_id, self.bid_id, doc_resource, self.bid_token), upload_files=[('file', 'name_{}.doc'.format(i), 'content')])
+                self.assertEqual(response.status, '201 Created')
+                doc_ids.append(response.json["data"]['id'])
+
+            response = self.app.put('/tenders/{}/bids/{}/{}/{}?acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, doc_ids[0], self.bid_token), upload_files=[('file', 'name_0.doc', 'content2')])
+            self.assertEqual(response.status, '200 OK')
+
+            response = self.app.get('/tenders/{}/bids/{}/{}?acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, self.bid_token))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual([i['id'] for i in response.json['data']], [doc_ids[1], doc_ids[2], doc_ids[0]])
+
+            response = self.app.get('/tenders/{}/bids/{}/{}?all=true&acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, self.bid_token))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual(len(response.json['data']), 4)
+
+            response = self.app.get('/tenders/{}/bids/{}/{}?limit=2&acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, self.bid_token))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual([i['id'] for i in response.json['data']], [doc_ids[1], doc_ids[2]])
+
+            response = self.app.get('/tenders/{}/bids/{}/{}?offset=2&limit=2&acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, self.bid_token))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual([i['id'] for i in response.json['data']], [doc_ids[0]])
+
+            response = self.app.get('/tenders/{}/bids/{}/{}?all=true&offset=3&acc_token={}'.format(
+                self.tender_id, self.bid_id, doc_resource, self.bid_token))
+            self.assertEqual(response.status, '200 OK')
+            self.assertEqual(len(response.json['data']), 1)
+            self.assertEqual(response.json['data'][0]['id'], doc_ids[0])
+
     def test_put_tender_bidder_document(self):
         doc_id_by_type = {}
         for doc_resource in ['documents', 'financial_documents', 'eligibility_documents', 'qualification_documents']:
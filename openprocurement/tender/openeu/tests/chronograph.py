@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 import unittest
+from datetime import timedelta
+from uuid import uuid4
+from iso8601 import parse_date
 
 from openprocurement.api.tests.base import test_organization
+from openprocurement.tender.openeu.design import get_due_tenders
 from openprocurement.tender.openeu.tests.base import BaseTenderContentWebTest, test_bids
 from copy import deepcopy
 
@@ -18,6 +22,60 @@ class TenderSwitchPreQualificationResourceTest(BaseTenderContentWebTest):
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.json['data']["status"], "active.pre-qualification")
 
+    def test_batch_switch_to_pre_qualification(self):
+        self.set_status('active.pre-qualification', {'status': self.initial_status})
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': [{'id': self.tender_id}]}, status=403)
+        self.assertEqual(response.status, '403 Forbidden')
+
+        self.app.authorization = ('Basic', ('chronograph', ''))
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': {'id': self.tender_id}}, status=422)
+        self.assertEqual(response.status, '422 Unprocessable Entity')
+        self.assertEqual(response.json['errors'], [
+            {u'description': u'Data not available', u'location': u'body', u'name': u'data'}
+        ])
+
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': [{'id': self.tender_id}, {'id': 'some_id'}]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual(response.json['data'][0]['id'], self.tender_id)
+        self.assertEqual(response.json['data'][0]['result'], 'updated')
+        self.assertEqual(response.json['data'][0]['status'], 'active.pre-qualification')
+        self.assertEqual(response.json['data'][1], {'id': 'some_id', 'result': 'not_found'})
+
+        response = self.app.get('/tenders/{}'.format(self.tender_id))
+        self.assertEqual(response.json['data']["status"], "active.pre-qualification")
+        self.assertEqual(len(response.json['data']["qualifications"]), len(self.initial_bids))
+
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': [{'id': self.tender_id}]})
+        self.assertEqual(response.json['data'][0]['result'], 'unchanged')
+
+        tender = self.db.get(self.tender_id)
+        del tender['_rev']
+        tender['_id'] = broken_id = uuid4().hex
+        tender['tenderPeriod'] = 'broken'
+        self.db.save(tender)
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': [{'id': broken_id}, {'id': self.tender_id}]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data'][0]['id'], broken_id)
+        self.assertEqual(response.json['data'][0]['result'], 'error')
+        self.assertEqual(response.json['data'][1]['result'], 'unchanged')
+
+    def test_batch_save_conflict(self):
+        self.set_status('active.pre-qualification', {'status': self.initial_status})
+        self.app.authorization = ('Basic', ('chronograph', ''))
+        # both copies of the tender are changed, the second write conflicts
+        response = self.app.post_json('/chronograph/aboveThresholdEU', {'data': [{'id': self.tender_id}, {'id': self.tender_id}]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data'][0]['result'], 'updated')
+        self.assertEqual(response.json['data'][1]['id'], self.tender_id)
+        self.assertEqual(response.json['data'][1]['result'], 'conflict')
+        self.assertEqual(response.json['data'][1]['errors'][0]['name'], 'data')
+        self.assertNotIn('Location', response.headers)
+
+        response = self.app.get('/tenders/{}'.format(self.tender_id))
+        self.assertEqual(response.json['data']["status"], "active.pre-qualification")
+        self.assertEqual(len(response.json['data']["qualifications"]), len(self.initial_bids))
+
 
 
 class TenderSwitchAuctionResourceTest(BaseTenderContentWebTest):
@@ -109,6 +167,33 @@ class TenderAuctionPeriodResourceTest(BaseTenderContentWebTest):
         self.assertIn('auctionPeriod', response.json['data'])
 
 
+class TenderNextCheckResourceTest(BaseTenderContentWebTest):
+    initial_status = 'active.tendering'
+
+    def test_due_tenders(self):
+        response = self.app.get('/tenders/{}'.format(self.tender_id))
+        self.assertEqual(response.status, '200 OK')
+        next_check = parse_date(response.json['data']['next_check'])
+
+        self.assertEqual(get_due_tenders(self.db, next_check - timedelta(seconds=1)), [])
+        self.assertEqual(get_due_tenders(self.db, next_check), [(self.tender_id, next_check)])
+        self.assertEqual(get_due_tenders(self.db, next_check + timedelta(days=1), limit=1), [(self.tender_id, next_check)])
+
+        # tenders are ordered by moments of checks around DST switch
+        for tender_id, next_check in [('a' * 32, '2016-03-27T03:30:00+03:00'), ('b' * 32, '2016-03-27T02:45:00+02:00')]:
+            self.db.save({'_id': tender_id, 'doc_type': 'Tender', 'procurementMethodType': 'aboveThresholdEU', 'next_check': next_check})
+        self.assertEqual(get_due_tenders(self.db, parse_date('2016-03-27T00:45:00Z')), [
+            ('a' * 32, parse_date('2016-03-27T03:30:00+03:00')),
+            ('b' * 32, parse_date('2016-03-27T02:45:00+02:00')),
+        ])
+        self.assertEqual(get_due_tenders(self.db, parse_date('2016-03-27T00:45:00Z'), limit=1), [
+            ('a' * 32, parse_date('2016-03-27T03:30:00+03:00')),
+        ])
+
+        tender = self.db.get(self.tender_id)
+        self.assertEqual(tender['next_check'], response.json['data']['next_check'])
+
+
 # class TenderLotAuctionPeriodResourceTest(BaseTenderWebTest):
 #     initial_status = 'active.tendering'
 #     initial_lots = test_lots
@@ -182,6 +267,7 @@ def suite():
     suite = unittest.TestSuite()
     # suite.addTest(unittest.makeSuite(TenderAwardComplaintSwitchResourceTest))
     suite.addTest(unittest.makeSuite(TenderComplaintSwitchResourceTest))
+    suite.addTest(unittest.makeSuite(TenderNextCheckResourceTest))
     # suite.addTest(unittest.makeSuite(TenderLotAwardComplaintSwitchResourceTest))
     # suite.addTest(unittest.makeSuite(TenderLotComplaintSwitchResourceTest))
     # suite.addTest(unittest.makeSuite(TenderLotSwitchAuctionResourceTest))
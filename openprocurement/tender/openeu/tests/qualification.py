@@ -154,6 +154,50 @@ class TenderQualificationResourceTest(BaseTenderContentWebTest):
             self.assertEqual(response.status, '200 OK')
             self.assertEqual(response.json['data']['status'], 'active')
 
+    def test_get_tender_qualifications_collection_filtered(self):
+        response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id))
+        qualifications = response.json['data']
+        q_id = qualifications[0]['id']
+        response = self.app.patch_json('/tenders/{}/qualifications/{}?acc_token={}'.format(self.tender_id, q_id, self.tender_token),
+                                       {"data": {"status": "active", "qualified": True, "eligible": True}})
+        self.assertEqual(response.status, '200 OK')
+
+        response = self.app.get('/tenders/{}/qualifications?status=active'.format(self.tender_id))
+        self.assertEqual([i['id'] for i in response.json['data']], [q_id])
+
+        response = self.app.get('/tenders/{}/qualifications?status=pending,active&offset=1&limit=1'.format(self.tender_id))
+        self.assertEqual([i['id'] for i in response.json['data']], [qualifications[1]['id']])
+
+        response = self.app.get('/tenders/{}/qualifications?opt_fields=status,bidID,documents'.format(self.tender_id))
+        self.assertEqual(response.json['data'][0], {'id': q_id, 'status': 'active', 'bidID': qualifications[0]['bidID']})
+        self.assertEqual(len(response.json['data']), len(qualifications))
+
+        if qualifications[0].get('lotID'):
+            response = self.app.get('/tenders/{}/qualifications?lotID={}'.format(self.tender_id, qualifications[0]['lotID']))
+            self.assertEqual(set([i['lotID'] for i in response.json['data']]), set([qualifications[0]['lotID']]))
+
+    def test_get_tender_qualification_not_modified(self):
+        response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id))
+        etag = response.headers['ETag']
+        q_id = response.json['data'][0]['id']
+
+        response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id), headers={'If-None-Match': etag}, status=304)
+        self.assertEqual(response.status, '304 Not Modified')
+        self.assertEqual(response.body, '')
+
+        response = self.app.get('/tenders/{}/qualifications/{}'.format(self.tender_id, q_id))
+        self.assertNotEqual(response.headers['ETag'], etag)
+        qualification_etag = response.headers['ETag']
+
+        response = self.app.patch_json('/tenders/{}/qualifications/{}?acc_token={}'.format(self.tender_id, q_id, self.tender_token),
+                                       {"data": {"title": "title"}})
+        self.assertEqual(response.status, '200 OK')
+
+        response = self.app.get('/tenders/{}/qualifications/{}'.format(self.tender_id, q_id), headers={'If-None-Match': qualification_etag})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data']['title'], 'title')
+        self.assertNotEqual(response.headers['ETag'], qualification_etag)
+
     def test_get_tender_qualifications(self):
         response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id))
         self.assertEqual(response.content_type, 'application/json')
@@ -182,6 +226,51 @@ class TenderQualificationResourceTest(BaseTenderContentWebTest):
         self.assertEqual(response.json['errors'], [{"description": u"Can't update qualification in current (active.pre-qualification.stand-still) tender status",
                                                     u'location': u'body', u'name': u'data'}])
 
+    def test_patch_tender_qualifications_collection(self):
+        response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id))
+        qualifications = response.json['data']
+
+        response = self.app.patch_json('/tenders/{}/qualifications?acc_token={}'.format(self.tender_id, self.tender_token),
+                                       {"data": {"status": "active"}}, status=422)
+        self.assertEqual(response.status, '422 Unprocessable Entity')
+        self.assertEqual(response.json['errors'][0]['description'], "Data not available")
+
+        # invalid item rejects the whole batch
+        response = self.app.patch_json('/tenders/{}/qualifications?acc_token={}'.format(self.tender_id, self.tender_token),
+                                       {"data": [{"id": qualifications[0]['id'], "status": "active", "qualified": True, "eligible": True},
+                                                 {"id": qualifications[1]['id'], "status": "active"},
+                                                 {"id": "some_id", "status": "active"}]}, status=422)
+        self.assertEqual(response.status, '422 Unprocessable Entity')
+        errors = response.json['errors'][0]['description']
+        self.assertEqual([i['id'] for i in errors], [qualifications[1]['id'], 'some_id'])
+        self.assertEqual(errors[1]['description'], 'Not Found')
+        response = self.app.get('/tenders/{}/qualifications'.format(self.tender_id))
+        self.assertEqual([i['status'] for i in response.json['data']], ['pending'] * len(qualifications))
+
+        response = self.app.patch_json('/tenders/{}/qualifications?acc_token={}'.format(self.tender_id, self.tender_token),
+                                       {"data": [{"id": i['id'], "status": "active", "qualified": True, "eligible": True}
+                                                 for i in qualifications]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual([i['id'] for i in response.json['data']], [i['id'] for i in qualifications])
+        self.assertEqual([i['status'] for i in response.json['data']], ['active'] * len(qualifications))
+
+        response = self.app.patch_json('/tenders/{}/qualifications?acc_token={}'.format(self.tender_id, self.tender_token),
+                                       {"data": [{"id": qualifications[0]['id'], "status": "cancelled"},
+                                                 {"id": qualifications[1]['id'], "status": "unsuccessful"}]}, status=403)
+        self.assertEqual(response.status, '403 Forbidden')
+        self.assertEqual(response.json['errors'][0]['description'], [
+            {u'id': qualifications[1]['id'], u'description': u"Can't update qualification status"}
+        ])
+
+        response = self.app.patch_json('/tenders/{}/qualifications?acc_token={}'.format(self.tender_id, self.tender_token),
+                                       {"data": [{"id": qualifications[0]['id'], "status": "cancelled"}]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.json['data'][0]['status'], 'cancelled')
+        new_id = response.json['data'][0]['new_qualification_id']
+        response = self.app.get('/tenders/{}/qualifications/{}'.format(self.tender_id, new_id))
+        self.assertEqual(response.json['data']['status'], 'pending')
+        self.assertEqual(response.json['data']['bidID'], qualifications[0]['bidID'])
+
 class Tender2LotQualificationResourceTest(TenderQualificationResourceTest):
     initial_status = 'active.tendering'  # 'active.pre-qualification.stand-still' status sets in setUp
     initial_lots = 2 * test_lots
@@ -4,10 +4,10 @@ from datetime import timedelta
 from copy import deepcopy
 
 from openprocurement.api import ROUTE_PREFIX
-from openprocurement.api.models import get_now, SANDBOX_MODE
+from openprocurement.api.models import get_now, SANDBOX_MODE, TZ
 from openprocurement.api.tests.base import test_organization
 from openprocurement.tender.openeu.models import Tender
-from openprocurement.tender.openeu.tests.base import (test_tender_data,
+from openprocurement.tender.openeu.tests.base import (test_tender_data, test_bids,
                                                       BaseTenderWebTest)
 
 
@@ -35,6 +35,30 @@ class TenderTest(BaseTenderWebTest):
 
         u.delete_instance(self.db)
 
+    def test_serialize_with_role_plans(self):
+        data = deepcopy(test_tender_data)
+        data['bids'] = deepcopy(test_bids)
+        data['bids'][0]['status'] = 'invalid'
+        for status in ['active.tendering', 'active.pre-qualification', 'active.qualification']:
+            data['status'] = status
+            u = Tender(data)
+            for role in Tender._options.roles:
+                self.assertEqual(u.serialize(role), super(Tender, u).serialize(role), role)
+
+    def test_next_check_follows_complaints(self):
+        data = deepcopy(test_tender_data)
+        data['complaints'] = [{'title': 'complaint title', 'description': 'complaint description', 'author': test_organization, 'status': 'draft'}]
+        u = Tender(data)
+        u._rev = '1-rev'
+        self.assertEqual(u.status, 'active.tendering')
+        next_check = u.tenderPeriod.endDate.astimezone(TZ).isoformat()
+        self.assertEqual(u.next_check, next_check)
+        # revision and status stay the same while the complaint blocks the tender
+        u.complaints[0].status = 'pending'
+        self.assertIsNone(u.next_check)
+        u.complaints[0].import_data({'status': 'resolved'})
+        self.assertEqual(u.next_check, next_check)
+
 
 class TenderResourceTest(BaseTenderWebTest):
 
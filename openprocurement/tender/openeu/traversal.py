@@ -12,30 +12,57 @@ def qualifications_factory(request):
     tender.__parent__ = root
     request.validated['tender'] = tender
     request.validated['tender_status'] = tender.status
-    if request.method != 'GET':
-        request.validated['tender_src'] = tender.serialize('plain')
     if request.matchdict.get('qualification_id'):
         qualification = get_item(tender, 'qualification', request)
         if request.matchdict.get('complaint_id'):
             complaint = get_item(qualification, 'complaint', request)
             if request.matchdict.get('document_id'):
-                return get_item(complaint, 'document', request)
+                return get_document(complaint, 'document', request)
             else:
                 return complaint
         elif request.matchdict.get('document_id'):
-            return get_item(qualification, 'document', request)
+            return get_document(qualification, 'document', request)
         else:
             return qualification
     request.validated['id'] = request.matchdict['tender_id']
     return tender
 
 
+def snapshot_tender(request):
+    """ takes the source snapshot of the tender used by apply_patch and save_tender
+
+        Factories of this package don't serialize the tender in advance, so
+        views call it right before changing the tender and rejected requests
+        don't pay for serialization.
+    """
+    if not request.validated.get('tender_src') and request.method != 'GET':
+        request.validated['tender_src'] = request.validated['tender'].serialize('plain')
+    return request.validated['tender_src']
+
+
+def get_documents_index(parent, container):
+    """ document id -> list of versions of the document in the container
+
+        Index is built on first access and rebuilt when the container is
+        replaced or a new document version is added to it.
+    """
+    documents = getattr(parent, container, None) or []
+    indexes = parent.__dict__.setdefault('_documents_index', {})
+    entry = indexes.get(container)
+    if entry is None or entry[0] is not documents or entry[1] != len(documents):
+        index = {}
+        for document in documents:
+            index.setdefault(document.id, []).append(document)
+        entry = indexes[container] = (documents, len(documents), index)
+    return entry[2]
+
+
 def get_document(parent, key, request):
     request.validated['document_id'] = request.matchdict['document_id']
 
     attr = key.split('_')
-    attr = attr[0] + attr[1].capitalize() + 's'
-    items = [i for i in getattr(parent, attr, []) if i.id == request.matchdict['document_id']]
+    attr = attr[0] + ''.join([i.capitalize() for i in attr[1:]]) + 's'
+    items = get_documents_index(parent, attr).get(request.matchdict['document_id'])
     if not items:
         from openprocurement.api.utils import error_handler
         request.errors.add('url', 'document_id', 'Not Found')
@@ -62,8 +89,6 @@ def handle_root(request):
     tender.__parent__ = root
     request.validated['tender'] = tender
     request.validated['tender_status'] = tender.status
-    if request.method != 'GET':
-        request.validated['tender_src'] = tender.serialize('plain')
 
 
 def bid_financial_documents_factory(request):
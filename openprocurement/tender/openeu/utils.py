@@ -1,16 +1,22 @@
 # -*- coding: utf-8 -*-
+from hashlib import md5
+from json import dumps
 from logging import getLogger
 from functools import partial
 from cornice.resource import resource
+from pyramid.httpexceptions import HTTPNotModified
+from pyramid.settings import asbool
 from openprocurement.api.models import get_now, TZ
+from schematics.types.compound import ListType, ModelType
 from openprocurement.api.utils import (
     check_tender_status,
     error_handler,
     context_unpack,
-    remove_draft_bids
+    remove_draft_bids,
+    save_tender,
 )
 from openprocurement.tender.openua.utils import BLOCK_COMPLAINT_STATUS, check_complaint_status
-from openprocurement.tender.openeu.models import Qualification
+from openprocurement.tender.openeu.models import Qualification, AwardRanking, get_role_plan
 from openprocurement.tender.openeu.traversal import (
     qualifications_factory, bid_financial_documents_factory,
     bid_eligibility_documents_factory, bid_qualification_documents_factory)
@@ -24,18 +30,90 @@ bid_eligibility_documents_resource = partial(resource, error_handler=error_handl
 bid_qualification_documents_resource = partial(resource, error_handler=error_handler, factory=bid_qualification_documents_factory)
 
 
+def paginate(request, items):
+    """ applies 'offset' and 'limit' query parameters to the list of items
+    """
+    offset = request.params.get('offset', '')
+    offset = int(offset) if offset.isdigit() else 0
+    limit = request.params.get('limit', '')
+    limit = int(limit) if limit.isdigit() and int(limit) > 0 else None
+    return items[offset:offset + limit] if limit else items[offset:]
+
+
+def get_not_modified(request, *extra):
+    """ returns 304 response when ETag of the requested resource is in
+        If-None-Match of the request, sets ETag of the response otherwise
+
+        ETag is built from the tender revision, the path with the query and
+        the role, extra values stand for data that isn't stored.
+    """
+    tender = request.validated['tender']
+    etag = md5(u'\n'.join(
+        [tender.rev or u'', request.path_qs, request.authenticated_role or u''] + [unicode(i) for i in extra]
+    ).encode('utf-8')).hexdigest()
+    if etag in request.if_none_match:
+        response = HTTPNotModified()
+        response.etag = etag
+        return response
+    request.response.etag = etag
+
+
+def serialize_fields(model, role, fields):
+    """ serializes only the listed scalar fields of the model visible for the role
+
+        Compound fields are skipped, id is always included.
+    """
+    plan = get_role_plan(type(model), role)
+    visible = plan[0] if plan else type(model)._fields.keys()
+    data = {}
+    for name in set(['id'] + fields):
+        field = type(model)._fields.get(name)
+        if field is None or name not in visible or isinstance(field, (ListType, ModelType)):
+            continue
+        value = model._data.get(name)
+        if value is not None:
+            data[name] = field.to_primitive(value)
+    return data
+
+
+def stream_json_data(request, items):
+    """ returns response writing {"data": [...]} with items encoded one by one
+
+        Returns None when pretty or JSONP output is requested, such
+        responses are left for the JSON renderer.
+    """
+    if request.params.get('opt_pretty') or request.params.get('opt_jsonp'):
+        return
+
+    def app_iter():
+        yield '{"data": ['
+        for index, item in enumerate(items):
+            yield (', ' if index else '') + dumps(item)
+        yield ']}'
+
+    response = request.response
+    response.content_type = 'application/json'
+    response.app_iter = app_iter()
+    return response
+
+
 def check_initial_bids_count(request):
     tender = request.validated['tender']
     if tender.lots:
-        [setattr(i.auctionPeriod, 'startDate', None) for i in tender.lots if i.numberOfBids < 2 and i.auctionPeriod and i.auctionPeriod.startDate]
+        # lot values of one lot don't affect number of bids of other lots
+        lots_numberOfBids = dict(tender.lots_numberOfBids())
+        [setattr(i.auctionPeriod, 'startDate', None) for i in tender.lots if lots_numberOfBids.get(i.id, 0) < 2 and i.auctionPeriod and i.auctionPeriod.startDate]
 
+        unsuccessful_lots = set()
         for i in tender.lots:
-            if i.numberOfBids < 2 and i.status == 'active':
+            if lots_numberOfBids.get(i.id, 0) < 2 and i.status == 'active':
                 setattr(i, 'status', 'unsuccessful')
-                for bid_index, bid in enumerate(tender.bids):
-                    for lot_index, lot_value in enumerate(bid.lotValues):
-                        if lot_value.relatedLot == i.id:
-                            setattr(tender.bids[bid_index].lotValues[lot_index], 'status', 'unsuccessful')
+                unsuccessful_lots.add(i.id)
+        if unsuccessful_lots:
+            for bid in tender.bids:
+                for lot_value in bid.lotValues:
+                    if lot_value.relatedLot in unsuccessful_lots:
+                        setattr(lot_value, 'status', 'unsuccessful')
 
         # [setattr(i, 'status', 'unsuccessful') for i in tender.lots if i.numberOfBids < 2 and i.status == 'active']
 
@@ -54,48 +132,79 @@ def check_initial_bids_count(request):
 def prepare_qualifications(request, bids=[], lotId=None):
     """ creates Qualification for each Bid
     """
-    new_qualifications = []
     tender = request.validated['tender']
     if not bids:
         bids = tender.bids
     if tender.lots:
-        active_lots = [lot.id for lot in tender.lots if lot.status == 'active']
-        for bid in bids:
-            if bid.status not in ['invalid', 'deleted']:
-                for lotValue in bid.lotValues:
-                    if lotValue.status == 'pending' and lotValue.relatedLot in active_lots:
-                        if lotId:
-                            if lotValue.relatedLot == lotId:
-                                qualification = Qualification({'bidID': bid.id, 'status': 'pending', 'lotID': lotId})
-                                tender.qualifications.append(qualification)
-                                new_qualifications.append(qualification.id)
-                        else:
-                            qualification = Qualification({'bidID': bid.id, 'status': 'pending', 'lotID': lotValue.relatedLot})
-                            tender.qualifications.append(qualification)
-                            new_qualifications.append(qualification.id)
+        active_lots = set([lot.id for lot in tender.lots if lot.status == 'active'])
+        if lotId:
+            active_lots &= set([lotId])
+        qualifications = [
+            Qualification({'bidID': bid.id, 'status': 'pending', 'lotID': lotValue.relatedLot})
+            for bid in bids
+            if bid.status not in ['invalid', 'deleted']
+            for lotValue in bid.lotValues
+            if lotValue.status == 'pending' and lotValue.relatedLot in active_lots
+        ]
     else:
-        for bid in bids:
-            if bid.status == 'pending':
-                qualification = Qualification({'bidID': bid.id, 'status': 'pending'})
-                tender.qualifications.append(qualification)
-                new_qualifications.append(qualification.id)
-    return new_qualifications
+        qualifications = [
+            Qualification({'bidID': bid.id, 'status': 'pending'})
+            for bid in bids
+            if bid.status == 'pending'
+        ]
+    tender.qualifications.extend(qualifications)
+    return [i.id for i in qualifications]
+
+
+def set_bid_status(tender, bid_id, status, lotId=None):
+    """ sets status of the bid or of its lot value when lotId is given
+    """
+    bids_index = tender.bids_index()
+    if lotId and (bid_id, lotId) in bids_index:
+        bid, lotValue = bids_index[(bid_id, lotId)]
+        lotValue.status = status
+        return bid
+    bid = bids_index.get(bid_id)
+    if bid is not None:
+        bid.status = status
+        return bid
+
+
+def apply_qualification_decision(request, qualification):
+    """ updates related bid according to the qualification status
+
+        Returns id of the new qualification generated for the bid when
+        qualification is cancelled.
+    """
+    tender = request.validated['tender']
+    if qualification.status == 'active':
+        # approve related bid
+        set_bid_status(tender, qualification.bidID, 'active', qualification.lotID)
+    elif qualification.status == 'unsuccessful':
+        # cancel related bid
+        set_bid_status(tender, qualification.bidID, 'unsuccessful', qualification.lotID)
+    elif qualification.status == 'cancelled':
+        # return bid to initial status
+        bid = set_bid_status(tender, qualification.bidID, 'pending', qualification.lotID)
+        # generate new qualification for related bid
+        return prepare_qualifications(request, bids=[bid], lotId=qualification.lotID)[0]
 
 
 def all_bids_are_reviewed(request):
     """ checks if all tender bids are reviewed
     """
-    if request.validated['tender'].lots:
-        active_lots = [lot.id for lot in request.validated['tender'].lots if lot.status == 'active']
+    tender = request.validated['tender']
+    if tender.lots:
+        lots_statuses = tender.lots_statuses()
         return all([
             lotValue.status != 'pending'
-            for bid in request.validated['tender'].bids
+            for bid in tender.bids
             if bid.status not in ['invalid', 'deleted']
             for lotValue in bid.lotValues
-            if lotValue.relatedLot in active_lots
+            if lots_statuses.get(lotValue.relatedLot) == 'active'
         ])
     else:
-        return all([bid.status != 'pending' for bid in request.validated['tender'].bids])
+        return all([bid.status != 'pending' for bid in tender.bids])
 
 
 def check_status(request):
@@ -158,10 +267,11 @@ def check_status(request):
     elif tender.lots and tender.status in ['active.qualification', 'active.awarded']:
         if any([i['status'] in ['claim', 'answered', 'pending'] for i in tender.complaints]):
             return
+        awards_by_lot = tender.awards_by_lot()
         for lot in tender.lots:
             if lot['status'] != 'active':
                 continue
-            lot_awards = [i for i in tender.awards if i.lotID == lot.id]
+            lot_awards = awards_by_lot.get(lot.id, [])
             standStillEnds = [
                 a.complaintPeriod.endDate.astimezone(TZ)
                 for a in lot_awards
@@ -186,6 +296,98 @@ def check_status(request):
                     check_tender_status(request)
 
 
+def get_lot_bids(tender, lot):
+    """ returns lot features and active bids of the lot prepared for chef
+    """
+    lot_items = [i.id for i in tender.items if i.relatedLot == lot.id]
+    features = [
+        i
+        for i in (tender.features or [])
+        if i.featureOf == 'tenderer' or i.featureOf == 'lot' and i.relatedItem == lot.id or i.featureOf == 'item' and i.relatedItem in lot_items
+    ]
+    codes = [i.code for i in features]
+    bids_index = tender.bids_index()
+    bids = [
+        {
+            'id': bid.id,
+            'value': lotValue.value,
+            'tenderers': bid.tenderers,
+            'parameters': [i for i in bid.parameters if i.code in codes],
+            'date': lotValue.date
+        }
+        for bid, lotValue in [bids_index[(i.id, lot.id)] for i in tender.bids if (i.id, lot.id) in bids_index]
+        if lotValue.status == "active"
+    ]
+    return features, bids
+
+
+def get_active_bids(tender, lot=None):
+    """ returns features and active bids of the tender or of the lot
+    """
+    if lot:
+        return get_lot_bids(tender, lot)
+    return tender.features or [], [bid for bid in tender.bids if bid.status == "active"]
+
+
+def get_ranking_fingerprint(features, bids):
+    """ returns hash of the data chef ranks bids by """
+    return md5(dumps([
+        [(i.code, [j.value for j in i.enum]) for i in features],
+        [
+            (bid['id'], bid['value']['amount'], bid['date'], [(i['code'], i['value']) for i in bid['parameters'] or []])
+            for bid in bids
+        ]
+    ], default=unicode)).hexdigest()
+
+
+def get_ranking(tender, lot=None):
+    """ returns active bids of the tender or of the lot ranked by chef
+
+        Rank of a bid doesn't depend on the other bids excluded by awards,
+        so the whole ranking is computed once, stored in the tender with
+        the fingerprint of the ranked data and reused by later requests
+        until the data changes.
+    """
+    key = lot.id if lot else 'tender'
+
+    def build():
+        features, bids = get_active_bids(tender, lot)
+        fingerprint = get_ranking_fingerprint(features, bids)
+        stored = (tender.awardRankings or {}).get(key)
+        if stored is not None and stored.fingerprint == fingerprint:
+            bids = dict([(i['id'], i) for i in bids])
+            return [bids[i] for i in stored.bids]
+        ranking = chef(bids, features, [])
+        tender.awardRankings = dict(tender.awardRankings or {}, **{key: AwardRanking({
+            'fingerprint': fingerprint,
+            'bids': [i['id'] for i in ranking],
+        })})
+        return ranking
+    return tender.get_cached('ranking_{}'.format(key), tender.bids, build)
+
+
+def get_next_bid(request, unsuccessful_awards, lot=None):
+    """ returns best ranked bid without unsuccessful award
+
+        With `debug_award_ranking` setting enabled the result is checked
+        against ranking of chef for the current awards.
+    """
+    tender = request.validated['tender']
+    unsuccessful_awards = set(unsuccessful_awards)
+    bid = next((i for i in get_ranking(tender, lot) if i['id'] not in unsuccessful_awards), None)
+    if asbool(request.registry.settings.get('debug_award_ranking', False)):
+        features, bids = get_active_bids(tender, lot)
+        bids = chef(bids, features, list(unsuccessful_awards))
+        expected = bids[0] if bids else None
+        bid_id = bid['id'] if bid is not None else None
+        expected_id = expected['id'] if expected is not None else None
+        if bid_id != expected_id:
+            LOGGER.error('Award ranking mismatch: {} instead of {}'.format(bid_id, expected_id),
+                         extra=context_unpack(request, {'MESSAGE_ID': 'award_ranking_mismatch'}, {'LOT_ID': lot.id if lot else None}))
+            bid = expected
+    return bid
+
+
 def add_next_award(request):
     tender = request.validated['tender']
     now = get_now()
@@ -195,39 +397,21 @@ def add_next_award(request):
         tender.awardPeriod.startDate = now
     if tender.lots:
         statuses = set()
+        awards_by_lot = tender.awards_by_lot()
         for lot in tender.lots:
             if lot.status != 'active':
                 continue
-            lot_awards = [i for i in tender.awards if i.lotID == lot.id]
+            lot_awards = awards_by_lot.get(lot.id, [])
             if lot_awards and lot_awards[-1].status in ['pending', 'active']:
                 statuses.add(lot_awards[-1].status if lot_awards else 'unsuccessful')
                 continue
-            lot_items = [i.id for i in tender.items if i.relatedLot == lot.id]
-            features = [
-                i
-                for i in (tender.features or [])
-                if i.featureOf == 'tenderer' or i.featureOf == 'lot' and i.relatedItem == lot.id or i.featureOf == 'item' and i.relatedItem in lot_items
-            ]
-            codes = [i.code for i in features]
-            bids = [
-                {
-                    'id': bid.id,
-                    'value': [i for i in bid.lotValues if lot.id == i.relatedLot][0].value,
-                    'tenderers': bid.tenderers,
-                    'parameters': [i for i in bid.parameters if i.code in codes],
-                    'date': [i for i in bid.lotValues if lot.id == i.relatedLot][0].date
-                }
-                for bid in tender.bids
-                if lot.id in [i.relatedLot for i in bid.lotValues if i.status == "active"]
-            ]
-            if not bids:
+            if not get_ranking(tender, lot):
                 lot.status = 'unsuccessful'
                 statuses.add('unsuccessful')
                 continue
             unsuccessful_awards = [i.bid_id for i in lot_awards if i.status == 'unsuccessful']
-            bids = chef(bids, features, unsuccessful_awards)
-            if bids:
-                bid = bids[0]
+            bid = get_next_bid(request, unsuccessful_awards, lot)
+            if bid is not None:
                 award = tender.__class__.awards.model_class({
                     'bid_id': bid['id'],
                     'lotID': lot.id,
@@ -239,6 +423,7 @@ def add_next_award(request):
                     }
                 })
                 tender.awards.append(award)
+                awards_by_lot.setdefault(lot.id, []).append(award)
                 request.response.headers['Location'] = request.route_url('Tender Awards', tender_id=tender.id, award_id=award['id'])
                 statuses.add('pending')
             else:
@@ -252,10 +437,9 @@ def add_next_award(request):
     else:
         if not tender.awards or tender.awards[-1].status not in ['pending', 'active']:
             unsuccessful_awards = [i.bid_id for i in tender.awards if i.status == 'unsuccessful']
-            active_bids = [bid for bid in tender.bids if bid.status == "active"]
-            bids = chef(active_bids, tender.features or [], unsuccessful_awards)
-            if bids:
-                bid = bids[0].serialize()
+            bid = get_next_bid(request, unsuccessful_awards)
+            if bid is not None:
+                bid = bid.serialize()
                 award = tender.__class__.awards.model_class({
                     'bid_id': bid['id'],
                     'status': 'pending',
@@ -273,3 +457,19 @@ def add_next_award(request):
         else:
             tender.awardPeriod.endDate = now
             tender.status = 'active.awarded'
+
+
+def save_tender_bids_delta(request, bids):
+    """ saves the tender changed by its owner and statuses of the given bids
+
+        Revision and dateModified are handled by save_tender, Tender.store
+        sends the tender data without bids to the `bids_delta` update handler,
+        which sets statuses of the given bids in the stored document, so
+        other bids aren't sent to the database.
+    """
+    tender = request.validated['tender']
+    tender.__dict__['_bids_statuses'] = dict([(bid.id, bid.status) for bid in bids])
+    try:
+        return save_tender(request)
+    finally:
+        tender.__dict__.pop('_bids_statuses', None)
@@ -1,7 +1,73 @@
 # -*- coding: utf-8 -*-
+from schematics.exceptions import ModelValidationError, ModelConversionError
+from openprocurement.api.utils import apply_data_patch
 from openprocurement.api.validation import validate_data
 from openprocurement.tender.openeu.models import Qualification
 
+CHRONOGRAPH_BATCH_SIZE = 100
+
 
 def validate_patch_qualification_data(request):
     return validate_data(request, Qualification, True)
+
+
+def validate_json_items_data(request):
+    try:
+        json = request.json_body
+    except ValueError as e:
+        request.errors.add('body', 'data', e.message)
+        request.errors.status = 422
+        return
+    data = json.get('data') if isinstance(json, dict) else None
+    if not isinstance(data, list) or not all([isinstance(i, dict) and isinstance(i.get('id'), basestring) for i in data]):
+        request.errors.add('body', 'data', "Data not available")
+        request.errors.status = 422
+        return
+    return data
+
+
+def validate_tenders_ids_data(request):
+    data = validate_json_items_data(request)
+    if data is None:
+        return
+    if len(data) > CHRONOGRAPH_BATCH_SIZE:
+        request.errors.add('body', 'data', "Can't check more than {} tenders at once".format(CHRONOGRAPH_BATCH_SIZE))
+        request.errors.status = 422
+        return
+    request.validated['tenders_ids'] = [i['id'] for i in data]
+
+
+def validate_patch_qualifications_data(request):
+    data = validate_json_items_data(request)
+    if data is None:
+        return
+    qualifications = dict([(i.id, i) for i in request.validated['tender'].qualifications])
+    errors = []
+    items = []
+    for item in data:
+        qualification = qualifications.get(item['id'])
+        if qualification is None:
+            errors.append({'id': item['id'], 'description': 'Not Found'})
+            continue
+        initial_data = qualification.serialize()
+        m = Qualification(initial_data)
+        new_patch = apply_data_patch(initial_data, dict([(k, v) for k, v in item.items() if k != 'id']))
+        try:
+            if new_patch:
+                m.import_data(new_patch, partial=True, strict=True)
+            m.__parent__ = qualification.__parent__
+            m.validate()
+        except (ModelValidationError, ModelConversionError) as e:
+            errors.append({'id': item['id'], 'description': e.message})
+            continue
+        role = qualification.get_role()
+        if role not in Qualification._options.roles:
+            request.errors.add('url', 'role', 'Forbidden')
+            request.errors.status = 403
+            return
+        items.append((qualification, m.to_patch(role)))
+    if errors:
+        request.errors.add('body', 'data', errors)
+        request.errors.status = 422
+        return
+    request.validated['qualifications_data'] = items
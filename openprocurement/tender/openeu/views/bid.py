@@ -9,6 +9,7 @@ from openprocurement.api.utils import (
     context_unpack,
 )
 from openprocurement.tender.openua.views.bid import TenderUABidResource as BaseResource
+from openprocurement.tender.openeu.utils import stream_json_data, get_not_modified
 
 
 @opresource(name='Tender EU Bids',
@@ -61,7 +62,14 @@ class TenderBidResource(BaseResource):
             self.request.errors.add('body', 'data', 'Can\'t view bids in current ({}) tender status'.format(self.request.validated['tender_status']))
             self.request.errors.status = 403
             return
-        return {'data': [i.serialize(self.request.validated['tender_status']) for i in tender.bids]}
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
+        role = self.request.validated['tender_status']
+        response = stream_json_data(self.request, (i.serialize(role) for i in tender.bids))
+        if response is None:
+            return {'data': [i.serialize(role) for i in tender.bids]}
+        return response
 
     @json_view(permission='view_tender')
     def get(self):
@@ -93,13 +101,15 @@ class TenderBidResource(BaseResource):
             }
 
         """
-        if self.request.authenticated_role == 'bid_owner':
-            return {'data': self.request.context.serialize('view')}
-        if self.request.validated['tender_status'] == 'active.tendering':
+        is_bid_owner = self.request.authenticated_role == 'bid_owner'
+        if not is_bid_owner and self.request.validated['tender_status'] == 'active.tendering':
             self.request.errors.add('body', 'data', 'Can\'t view bid in current ({}) tender status'.format(self.request.validated['tender_status']))
             self.request.errors.status = 403
             return
-        return {'data': self.request.context.serialize(self.request.validated['tender_status'])}
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
+        return {'data': self.request.context.serialize('view' if is_bid_owner else self.request.validated['tender_status'])}
 
     @json_view(content_type="application/json", permission='edit_bid', validators=(validate_patch_bid_data,))
     def patch(self):
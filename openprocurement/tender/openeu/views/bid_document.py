@@ -15,9 +15,10 @@ from openprocurement.api.validation import (
     validate_file_upload,
     validate_patch_document_data,
 )
+from openprocurement.tender.openeu.traversal import snapshot_tender, get_documents_index
 from openprocurement.tender.openeu.utils import (
     bid_financial_documents_resource, bid_eligibility_documents_resource,
-    bid_qualification_documents_resource,
+    bid_qualification_documents_resource, paginate, get_not_modified,
 )
 from openprocurement.tender.openua.views.bid_document import TenderUaBidDocumentResource
 
@@ -44,12 +45,17 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Can\'t view bid documents in current ({}) tender status'.format(self.request.validated['tender_status']))
             self.request.errors.status = 403
             return
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
         if self.request.params.get('all', ''):
-            collection_data = [i.serialize("restricted_view") if self._doc_access_restricted(i) else i.serialize("view")
-                               for i in getattr(self.context, self.container)]
+            documents = getattr(self.context, self.container)
         else:
-            collection_data = sorted(dict([(i.id, i.serialize("restricted_view") if self._doc_access_restricted(i) else i.serialize("view"))
-                                           for i in getattr(self.context, self.container)]).values(), key=lambda i: i['dateModified'])
+            # only latest versions are serialized
+            documents = sorted([i[-1] for i in get_documents_index(self.context, self.container).values()],
+                               key=lambda i: i.dateModified)
+        collection_data = [i.serialize("restricted_view") if self._doc_access_restricted(i) else i.serialize("view")
+                           for i in paginate(self.request, documents)]
         return {'data': collection_data}
 
     @json_view(validators=(validate_file_upload,), permission='edit_bid')
@@ -65,7 +71,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Document can be added only during the tendering period: from ({}) to ({}).'.format(tender.tenderPeriod.startDate and tender.tenderPeriod.startDate.isoformat(), tender.tenderPeriod.endDate.isoformat()))
             self.request.errors.status = 403
             return
-        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards if i.status == 'pending' and i.bid_id == self.request.validated['bid_id']]:
+        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards_by_bid().get(self.request.validated['bid_id'], []) if i.status == 'pending']:
             self.request.errors.add('body', 'data', 'Can\'t add document because award of bid is not in pending state')
             self.request.errors.status = 403
             return
@@ -73,6 +79,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Can\'t add document to \'{}\' bid'.format(self.context.status))
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         document = upload_file(self.request)
         getattr(self.context, self.container).append(document)
         if self.request.validated['tender_status'] == 'active.tendering':
@@ -102,9 +109,13 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
                 return
             else:
                 return get_file(self.request)
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
         document_data = document.serialize('restricted_view' if self._doc_access_restricted(document) else 'view')
+        versions = get_documents_index(document.__parent__, self.container).get(document.id, [])
         document_data['previousVersions'] = [i.serialize('restricted_view') if self._doc_access_restricted(i) else i.serialize('view')
-                                             for i in self.request.validated['documents'] if i.url != document.url]
+                                             for i in versions if i.url != document.url]
         return {'data': document_data}
 
     @json_view(content_type="application/json", validators=(validate_patch_document_data,), permission='edit_bid')
@@ -119,7 +130,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Document can be updated only during the tendering period: from ({}) to ({}).'.format(tender.tenderPeriod.startDate and tender.tenderPeriod.startDate.isoformat(), tender.tenderPeriod.endDate.isoformat()))
             self.request.errors.status = 403
             return
-        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards if i.status == 'pending' and i.bid_id == self.request.validated['bid_id']]:
+        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards_by_bid().get(self.request.validated['bid_id'], []) if i.status == 'pending']:
             self.request.errors.add('body', 'data', 'Can\'t update document because award of bid is not in pending state')
             self.request.errors.status = 403
             return
@@ -133,6 +144,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Can\'t update document data for \'{}\' bid'.format(bid.status))
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         if self.request.validated['tender_status'] == 'active.tendering':
             self.request.validated['tender'].modified = False
         if apply_patch(self.request, src=self.request.context.serialize()):
@@ -153,7 +165,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Document can be updated only during the tendering period: from ({}) to ({}).'.format(tender.tenderPeriod.startDate and tender.tenderPeriod.startDate.isoformat(), tender.tenderPeriod.endDate.isoformat()))
             self.request.errors.status = 403
             return
-        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards if i.status == 'pending' and i.bid_id == self.request.validated['bid_id']]:
+        if self.request.validated['tender_status'] == 'active.qualification' and not [i for i in self.request.validated['tender'].awards_by_bid().get(self.request.validated['bid_id'], []) if i.status == 'pending']:
             self.request.errors.add('body', 'data', 'Can\'t update document because award of bid is not in pending state')
             self.request.errors.status = 403
             return
@@ -162,6 +174,7 @@ class TenderEUBidDocumentResource(TenderUaBidDocumentResource):
             self.request.errors.add('body', 'data', 'Can\'t update document in \'{}\' bid'.format(bid.status))
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         document = upload_file(self.request)
         getattr(self.request.validated['bid'], self.container).append(document)
         if self.request.validated['tender_status'] == 'active.tendering':
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+from couchdb import ResourceConflict
+from cornice.resource import resource
+from openprocurement.api.traversal import Root
+from openprocurement.api.utils import (
+    save_tender,
+    error_handler,
+    json_view,
+    context_unpack,
+    APIResource,
+)
+from openprocurement.tender.openeu.utils import check_status
+from openprocurement.tender.openeu.validation import validate_tenders_ids_data
+
+
+@resource(name='TenderEU Chronograph',
+          path='/chronograph/aboveThresholdEU',
+          factory=Root,
+          error_handler=error_handler,
+          description="TenderEU batch chronograph checks")
+class TenderEUChronographResource(APIResource):
+
+    @json_view(content_type="application/json", validators=(validate_tenders_ids_data,), permission='edit_tender')
+    def post(self):
+        """Check status of several tenders at once
+
+        Loads all tenders from the list with one request to the database,
+        runs the same status checks as chronograph PATCH of a single tender
+        and saves changed tenders with one bulk request. Failure or conflict
+        of one tender is reported in its result and doesn't affect others.
+        """
+        if self.request.authenticated_role != 'chronograph':
+            self.request.errors.add('body', 'data', 'Only chronograph can check tenders')
+            self.request.errors.status = 403
+            return
+        validated = dict(self.request.validated)
+        results = []
+        # tenders changed by checks, saved at once after all checks
+        changed = []
+        rows = self.db.view('_all_docs', keys=self.request.validated['tenders_ids'], include_docs=True)
+        for row in rows:
+            tender_id = row.key
+            doc = row.doc
+            if doc is None or doc.get('doc_type') != 'Tender' or doc.get('procurementMethodType') != 'aboveThresholdEU':
+                results.append({'id': tender_id, 'result': 'not_found'})
+                continue
+            # state of the previous tender doesn't leak into the next one
+            self.request.validated = dict(validated)
+            results.append(self.check_tender(tender_id, doc, changed))
+        self.request.validated = validated
+        if changed:
+            self.save_tenders(changed)
+        return {'data': results}
+
+    def check_tender(self, tender_id, doc, changed):
+        result = {'id': tender_id}
+        errors = self.request.errors
+        errors_count, errors_status = len(errors), errors.status
+        context = self.request.context
+        docs = []
+        try:
+            tender = self.request.tender_from_data(doc)
+            tender.__parent__ = context
+            self.request.context = tender
+            self.request.validated['tender'] = tender
+            self.request.validated['tender_id'] = tender_id
+            self.request.validated['tender_status'] = tender.status
+            self.request.validated['tender_src'] = tender.serialize('plain')
+            check_status(self.request)
+            # save_tender stores the tender into docs instead of the database
+            tender.__dict__['_bulk_docs'] = docs
+            saved = save_tender(self.request)
+        except Exception as e:
+            self.LOGGER.exception('Failed to check tender {}'.format(tender_id),
+                                  extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_chronograph_batch_error'}, {'TENDER_ID': tender_id}))
+            result['result'] = 'error'
+            result['errors'] = [{'location': 'body', 'name': 'data', 'description': str(e)}]
+            return result
+        finally:
+            # errors of one tender don't fail the whole batch
+            tender_errors = errors[errors_count:]
+            del errors[errors_count:]
+            errors.status = errors_status
+            self.request.context = context
+            self.request.response.headers.pop('Location', None)
+        tender.__dict__.pop('_bulk_docs', None)
+        if tender_errors:
+            result['result'] = 'error'
+            result['errors'] = tender_errors
+        elif saved and docs:
+            changed.append((result, tender, docs[0]))
+        else:
+            result['result'] = 'unchanged'
+        result['status'] = tender.status
+        result['next_check'] = tender.next_check
+        return result
+
+    def save_tenders(self, changed):
+        """ saves changed tenders with one request to the database """
+        for (result, tender, doc), (success, tender_id, rev) in zip(changed, self.db.update([i[2] for i in changed])):
+            if success:
+                tender._rev = rev
+                result['result'] = 'updated'
+                self.LOGGER.info('Updated tender {}'.format(tender_id),
+                                 extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_chronograph_batch'}, {'TENDER_ID': tender_id, 'TENDER_REV': rev}))
+            else:
+                # rev is the exception of the failed write
+                result['result'] = 'conflict' if isinstance(rev, ResourceConflict) else 'error'
+                result['errors'] = [{'location': 'body', 'name': 'data', 'description': str(rev)}]
+                self.LOGGER.info('Failed to save tender {}: {}'.format(tender_id, rev),
+                                 extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_chronograph_batch_conflict'}, {'TENDER_ID': tender_id}))
@@ -10,6 +10,7 @@ from openprocurement.api.utils import (
 from openprocurement.api.validation import (
     validate_lot_data,
 )
+from openprocurement.tender.openeu.utils import get_not_modified, save_tender_bids_delta
 
 
 @opresource(name='Tender EU Lots',
@@ -19,6 +20,28 @@ from openprocurement.api.validation import (
             description="Tender EU lots")
 class TenderEULotResource(TenderLotResource):
 
+    @json_view(permission='view_tender')
+    def collection_get(self):
+        """Lots Listing
+        """
+        not_modified = get_not_modified(self.request, *[
+            i.auctionPeriod and i.auctionPeriod.should_start_after()
+            for i in self.request.validated['tender'].lots
+        ])
+        if not_modified is not None:
+            return not_modified
+        return super(TenderEULotResource, self).collection_get()
+
+    @json_view(permission='view_tender')
+    def get(self):
+        """Retrieving the lot
+        """
+        lot = self.request.context
+        not_modified = get_not_modified(self.request, lot.auctionPeriod and lot.auctionPeriod.should_start_after())
+        if not_modified is not None:
+            return not_modified
+        return super(TenderEULotResource, self).get()
+
     @json_view(content_type="application/json", validators=(validate_lot_data,), permission='edit_tender')
     def collection_post(self):
         """Add a lot
@@ -29,8 +52,10 @@ class TenderEULotResource(TenderLotResource):
         tender = self.request.validated['tender']
         tender.lots.append(lot)
         if self.request.authenticated_role == 'tender_owner':
-            tender.invalidate_bids_data()
-        if save_tender(self.request):
+            saved = save_tender_bids_delta(self.request, tender.invalidate_bids_data())
+        else:
+            saved = save_tender(self.request)
+        if saved:
             self.LOGGER.info('Created tender lot {}'.format(lot.id),
                         extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_lot_create'}, {'lot_id': lot.id}))
             self.request.response.status = 201
@@ -1,13 +1,24 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
+    apply_data_patch,
     apply_patch,
     save_tender,
     json_view,
     context_unpack,
     APIResource,
 )
-from openprocurement.tender.openeu.validation import validate_patch_qualification_data
-from openprocurement.tender.openeu.utils import qualifications_resource, prepare_qualifications
+from openprocurement.tender.openeu.traversal import snapshot_tender
+from openprocurement.tender.openeu.validation import (
+    validate_patch_qualification_data,
+    validate_patch_qualifications_data,
+)
+from openprocurement.tender.openeu.utils import (
+    qualifications_resource,
+    apply_qualification_decision,
+    paginate,
+    serialize_fields,
+    get_not_modified,
+)
 
 
 @qualifications_resource(
@@ -21,31 +32,39 @@ class TenderQualificationResource(APIResource):
     @json_view(permission='view_tender')
     def collection_get(self):
         """List qualifications
+
+        Qualifications can be filtered by `lotID` and `status` (comma
+        separated), paged with `offset` and `limit` and reduced to the
+        fields listed in `opt_fields`.
         """
-        return {'data': [i.serialize("view") for i in self.request.validated['tender'].qualifications]}
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
+        qualifications = self.request.validated['tender'].qualifications
+        if self.request.params.get('lotID'):
+            qualifications = [i for i in qualifications if i.lotID == self.request.params['lotID']]
+        if self.request.params.get('status'):
+            statuses = self.request.params['status'].split(',')
+            qualifications = [i for i in qualifications if i.status in statuses]
+        qualifications = paginate(self.request, qualifications)
+        if self.request.params.get('opt_fields'):
+            fields = self.request.params['opt_fields'].split(',')
+            return {'data': [serialize_fields(i, "view", fields) for i in qualifications]}
+        return {'data': [i.serialize("view") for i in qualifications]}
 
     @json_view(permission='view_tender')
     def get(self):
         """Retrieving the qualification
         """
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
         return {'data': self.request.validated['qualification'].serialize("view")}
 
     @json_view(content_type="application/json", validators=(validate_patch_qualification_data,), permission='edit_tender')
     def patch(self):
         """Post a qualification resolution
         """
-        def set_bid_status(tender, bid_id, status, lotId=None):
-            if lotId:
-                for bid in tender.bids:
-                    if bid.id == bid_id:
-                        for lotValue in bid.lotValues:
-                            if lotValue.relatedLot == lotId:
-                                lotValue.status = status
-                                return bid
-            for bid in tender.bids:
-                if bid.id == bid_id:
-                    bid.status = status
-                    return bid
         tender = self.request.validated['tender']
         if tender.status not in ['active.pre-qualification']:
             self.request.errors.add('body', 'data', 'Can\'t update qualification in current ({}) tender status'.format(tender.status))
@@ -56,27 +75,59 @@ class TenderQualificationResource(APIResource):
             self.request.errors.status = 403
             return
 
+        snapshot_tender(self.request)
         prev_status = self.request.context.status
         apply_patch(self.request, save=False, src=self.request.context.serialize())
         if prev_status != 'pending' and self.request.context.status != 'cancelled':
             self.request.errors.add('body', 'data', 'Can\'t update qualification status'.format(tender.status))
             self.request.errors.status = 403
             return
-        if self.request.context.status == 'active':
-            # approve related bid
-            set_bid_status(tender, self.request.context.bidID, 'active', self.request.context.lotID)
-        elif self.request.context.status == 'unsuccessful':
-            # cancel related bid
-            set_bid_status(tender, self.request.context.bidID, 'unsuccessful', self.request.context.lotID)
-        elif self.request.context.status == 'cancelled':
-            # return bid to initial status
-            bid = set_bid_status(tender, self.request.context.bidID, 'pending', self.request.context.lotID)
-            # generate new qualification for related bid
-            ids = prepare_qualifications(self.request, bids=[bid], lotId=self.request.context.lotID)
+        new_id = apply_qualification_decision(self.request, self.request.context)
+        if new_id:
             self.request.response.headers['Location'] = self.request.route_url('TenderEU Qualification',
                                                                                tender_id=tender.id,
-                                                                               qualification_id=ids[0])
+                                                                               qualification_id=new_id)
         if save_tender(self.request):
             self.LOGGER.info('Updated tender qualification {}'.format(self.request.context.id),
                         extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_qualification_patch'}))
             return {'data': self.request.context.serialize("view")}
+
+    @json_view(content_type="application/json", validators=(validate_patch_qualifications_data,), permission='edit_tender')
+    def collection_patch(self):
+        """Post resolutions of several qualifications
+
+        All resolutions are applied with a single tender save, none of them
+        is applied if any one can't be.
+        """
+        tender = self.request.validated['tender']
+        if tender.status not in ['active.pre-qualification']:
+            self.request.errors.add('body', 'data', 'Can\'t update qualification in current ({}) tender status'.format(tender.status))
+            self.request.errors.status = 403
+            return
+        snapshot_tender(self.request)
+        errors = []
+        results = []
+        for qualification, data in self.request.validated['qualifications_data']:
+            if qualification.status == 'cancelled':
+                errors.append({'id': qualification.id, 'description': 'Can\'t update qualification in current cancelled qualification status'})
+                continue
+            prev_status = qualification.status
+            patch = apply_data_patch(qualification.serialize(), data)
+            if patch:
+                qualification.import_data(patch)
+            if prev_status != 'pending' and qualification.status != 'cancelled':
+                errors.append({'id': qualification.id, 'description': 'Can\'t update qualification status'})
+                continue
+            new_id = apply_qualification_decision(self.request, qualification)
+            result = qualification.serialize("view")
+            if new_id:
+                result['new_qualification_id'] = new_id
+            results.append(result)
+        if errors:
+            self.request.errors.add('body', 'data', errors)
+            self.request.errors.status = 403
+            return
+        if save_tender(self.request):
+            self.LOGGER.info('Updated tender qualifications {}'.format(', '.join([i['id'] for i in results])),
+                        extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_qualifications_patch'}))
+            return {'data': results}
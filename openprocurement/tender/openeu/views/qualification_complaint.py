@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import get_now
+from openprocurement.tender.openeu.traversal import snapshot_tender
 from openprocurement.tender.openeu.utils import qualifications_resource
 from openprocurement.tender.openeu.views.award_complaint import TenderEUAwardComplaintResource
 from openprocurement.api.utils import (
@@ -45,6 +46,7 @@ class TenderEUQualificationComplaintResource(TenderEUAwardComplaintResource):
             self.request.errors.add('body', 'data', 'Can add complaint only in qualificationPeriod')
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         complaint = self.request.validated['complaint']
         complaint.relatedLot = self.context.lotID
         complaint.type = 'complaint'
@@ -84,6 +86,7 @@ class TenderEUQualificationComplaintResource(TenderEUAwardComplaintResource):
             self.request.errors.add('body', 'data', 'Can\'t update complaint in current ({}) status'.format(self.context.status))
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         data = self.request.validated['data']
         is_qualificationPeriod = tender.qualificationPeriod.startDate < get_now() and (not tender.qualificationPeriod.endDate or tender.qualificationPeriod.endDate > get_now())
         # complaint_owner
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from openprocurement.tender.openeu.views.award_complaint_document import TenderEUAwardComplaintDocumentResource
+from openprocurement.tender.openeu.traversal import snapshot_tender
 from openprocurement.tender.openeu.utils import qualifications_resource
 from openprocurement.tender.openua.views.complaint_document import STATUS4ROLE
 
@@ -28,4 +29,5 @@ class TenderEUQualificationComplaintDocumentResource(TenderEUAwardComplaintDocum
             self.request.errors.add('body', 'data', 'Can\'t {} document in current ({}) complaint status'.format(operation, self.request.validated['complaint'].status))
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         return True
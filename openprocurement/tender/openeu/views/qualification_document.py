@@ -14,7 +14,8 @@ from openprocurement.api.validation import (
     validate_file_upload,
     validate_patch_document_data,
 )
-from openprocurement.tender.openeu.utils import qualifications_resource
+from openprocurement.tender.openeu.traversal import snapshot_tender
+from openprocurement.tender.openeu.utils import qualifications_resource, get_not_modified
 
 
 @qualifications_resource(
@@ -28,6 +29,9 @@ class TenderQualificationDocumentResource(APIResource):
     @json_view(permission='view_tender')
     def collection_get(self):
         """Tender Qualification Documents List"""
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
         if self.request.params.get('all', ''):
             collection_data = [i.serialize("view") for i in self.context.documents]
         else:
@@ -50,6 +54,7 @@ class TenderQualificationDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t add document in current qualification status')
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         document = upload_file(self.request)
         self.context.documents.append(document)
         if save_tender(self.request):
@@ -65,6 +70,9 @@ class TenderQualificationDocumentResource(APIResource):
         """Tender Qualification Document Read"""
         if self.request.params.get('download'):
             return get_file(self.request)
+        not_modified = get_not_modified(self.request)
+        if not_modified is not None:
+            return not_modified
         document = self.request.validated['document']
         document_data = document.serialize("view")
         document_data['previousVersions'] = [
@@ -86,6 +94,7 @@ class TenderQualificationDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update document in current qualification status')
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         document = upload_file(self.request)
         self.request.validated['qualification'].documents.append(document)
         if save_tender(self.request):
@@ -105,6 +114,7 @@ class TenderQualificationDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update document in current qualification status')
             self.request.errors.status = 403
             return
+        snapshot_tender(self.request)
         if apply_patch(self.request, src=self.request.context.serialize()):
             update_file_content_type(self.request)
             self.LOGGER.info('Updated tender qualification document {}'.format(self.request.context.id),
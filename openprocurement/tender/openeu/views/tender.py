@@ -2,7 +2,7 @@
 from openprocurement.api.models import get_now
 from openprocurement.api.views.tender import TenderResource
 from openprocurement.tender.openeu.models import PREQUALIFICATION_COMPLAINT_STAND_STILL as COMPLAINT_STAND_STILL
-from openprocurement.tender.openeu.utils import check_status, all_bids_are_reviewed
+from openprocurement.tender.openeu.utils import check_status, all_bids_are_reviewed, save_tender_bids_delta
 from openprocurement.tender.openua.models import TENDERING_EXTRA_PERIOD
 from openprocurement.tender.openua.utils import calculate_business_date
 from openprocurement.tender.openua.validation import validate_patch_tender_ua_data
@@ -85,6 +85,7 @@ class TenderEUResource(TenderResource):
         if self.request.authenticated_role == 'tender_owner' and self.request.validated['tender_status'] == 'active.tendering':
             if 'tenderPeriod' in data and 'endDate' in data['tenderPeriod']:
                 self.request.validated['tender'].tenderPeriod.import_data(data['tenderPeriod'])
+                # openua calculate_business_date, dates counted from now aren't memoized
                 if calculate_business_date(get_now(), TENDERING_EXTRA_PERIOD, self.request.validated['tender']) > self.request.validated['tender'].tenderPeriod.endDate:
                     self.request.errors.add('body', 'data', 'tenderPeriod should be extended by {0.days} days'.format(TENDERING_EXTRA_PERIOD))
                     self.request.errors.status = 403
@@ -93,10 +94,11 @@ class TenderEUResource(TenderResource):
                 self.request.validated['data']["enquiryPeriod"] = self.request.validated['tender'].enquiryPeriod.serialize()
 
         apply_patch(self.request, save=False, src=self.request.validated['tender_src'])
+        invalidated_bids = None
         if self.request.authenticated_role == 'chronograph':
             check_status(self.request)
         elif self.request.authenticated_role == 'tender_owner' and tender.status == 'active.tendering':
-            tender.invalidate_bids_data()
+            invalidated_bids = tender.invalidate_bids_data()
         elif self.request.authenticated_role == 'tender_owner' and self.request.validated['tender_status'] == 'active.pre-qualification' and tender.status == "active.pre-qualification.stand-still":
             if all_bids_are_reviewed(self.request):
                 tender.qualificationPeriod.endDate = calculate_business_date(get_now(), COMPLAINT_STAND_STILL, self.request.validated['tender'])
@@ -106,7 +108,10 @@ class TenderEUResource(TenderResource):
                 self.request.errors.status = 403
                 return
 
-        save_tender(self.request)
+        if invalidated_bids is None:
+            save_tender(self.request)
+        elif not save_tender_bids_delta(self.request, invalidated_bids):
+            return
         self.LOGGER.info('Updated tender {}'.format(tender.id),
                     extra=context_unpack(self.request, {'MESSAGE_ID': 'tender_patch'}))
         return {'data': tender.serialize(tender.status)}
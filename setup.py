@@ -6,7 +6,8 @@ version = '2.3.3'
 requires = [
     'setuptools',
     'openprocurement.api>=2.3',
-    'openprocurement.tender.openua'
+    'openprocurement.tender.openua',
+    'repoze.lru',
 ]
 
 test_requires = requires + [
@@ -44,7 +45,7 @@ setup(name='openprocurement.tender.openeu',
       author_email='info@quintagroup.com',
       url='https://github.com/openprocurement/openprocurement.tender.openeu',
       license='Apache License 2.0',
-      packages=find_packages(exclude=['ez_setup']),
+      packages=find_packages(exclude=['ez_setup', 'benchmarks']),
       namespace_packages=['openprocurement', 'openprocurement.tender'],
       include_package_data=True,
       zip_safe=False,